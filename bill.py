@@ -1,20 +1,18 @@
 from functools import partial
-import json
 from datetime import datetime
 import sys
 import os
 
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QVBoxLayout, QGridLayout, QWidget, QPushButton, QTableWidgetItem, 
+    QApplication, QMainWindow, QVBoxLayout, QGridLayout, QWidget, QPushButton,
     QCalendarWidget, QLineEdit, QLabel, QMessageBox, QComboBox, QHBoxLayout, QTabWidget, QFileDialog,
     QDialog, QProgressBar, QCheckBox, QMenu
 )
 
 from PyQt5.QtPrintSupport import QPrinter, QPrintDialog, QPrintPreviewDialog, QPageSetupDialog
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtGui import QPixmapCache
 
-from PyQt5.QtCore import Qt, QTimer
-import sqlite3
+from PyQt5.QtCore import Qt, QThreadPool, QTimer
 
 from database.databaseManager import DatabaseManager
 from mindeeApi.mindeeAPIConfigDialog import MindeeAPIConfigDialog
@@ -23,13 +21,16 @@ from mindeeApi.mindeeWorker import MindeeWorker
 from mindeeApi.ocrResultsDialog import OCRResultsDialog
 from util.dateHelper import DateHelper
 from util.trie import Trie
-from util.uiHelper import SettingsManager, UIHelper
+from util.workers import ImageCopier, TrieLoader
+from util.settingsManager import SettingsManager
+from util.uiHelper import UIHelper
 from util.style import Style
 
 
 # Define constants
 DATE_FORMAT = "%m/%d/%Y"
-DATE_FORMATS = ["%m/%d/%y", "%m/%d/%Y"]
+MONTH_NAMES = tuple(datetime(1900, month, 1).strftime("%B") for month in range(1, 13))
+TAB_TITLES = ("Dashboard", "Bill Entry", "Manage Bills", "Photos", "Reports", "Settings")
 
 # Main Application Class
 class BillTracker(QMainWindow):
@@ -40,6 +41,10 @@ class BillTracker(QMainWindow):
         
         # Initialize managers
         self.db_manager = DatabaseManager()
+        QPixmapCache.setCacheLimit(65536)  # 64 MiB for scaled previews and photo cards
+        self._known_years = set()
+        self.bill_sort_order = None  # Sort order of the print page table
+        self.delete_sort_order = None  # Sort order of the delete page table
         
         # Set up OCR functionality
         self.setup_ocr()
@@ -53,6 +58,7 @@ class BillTracker(QMainWindow):
         self.setCentralWidget(self.tab_widget)
 
         self.predefined_order = self.load_categories()
+        self.update_category_rank()
         self.selected_categories = []
         self.selected_image_path = None
         
@@ -64,13 +70,13 @@ class BillTracker(QMainWindow):
         self.init_data_page()
         self.init_settings_page()
 
-        # Add pages to tab widget with new structure
-        self.tab_widget.addTab(self.dashboard_page, UIHelper.translate("Dashboard"))
-        self.tab_widget.addTab(self.bill_page, UIHelper.translate("Bill Entry"))
-        self.tab_widget.addTab(self.manage_bills_page, UIHelper.translate("Manage Bills"))
-        self.tab_widget.addTab(self.photos_page, UIHelper.translate("Photos"))  # Add photos tab
-        self.tab_widget.addTab(self.data_page, UIHelper.translate("Reports"))
-        self.tab_widget.addTab(self.settings_page, UIHelper.translate("Settings"))
+        # Add pages to tab widget with new structure, in TAB_TITLES order
+        pages = (
+            self.dashboard_page, self.bill_page, self.manage_bills_page,
+            self.photos_page, self.data_page, self.settings_page
+        )
+        for page, title in zip(pages, TAB_TITLES):
+            self.tab_widget.addTab(page, UIHelper.translate(title))
         
         # Load existing databases and bills
         self.load_existing_databases()
@@ -82,8 +88,10 @@ class BillTracker(QMainWindow):
 
         self.update_settings_page()
 
-        # Initialize the trie for name suggestions
+        # Initialize the trie for name suggestions; it is filled in the background
         self.trie = Trie()
+        self.trie_ready = False
+        self.pending_names = []  # Names saved before the trie finished loading
         self.load_names_into_trie()
         
         # Show notifications area
@@ -125,12 +133,8 @@ class BillTracker(QMainWindow):
         self.setWindowTitle(UIHelper.translate('Bill Tracker'))
         
         # Update tab names
-        self.tab_widget.setTabText(0, UIHelper.translate("Dashboard"))
-        self.tab_widget.setTabText(1, UIHelper.translate("Bill Entry"))
-        self.tab_widget.setTabText(2, UIHelper.translate("Manage Bills"))
-        self.tab_widget.setTabText(3, UIHelper.translate("Photos"))
-        self.tab_widget.setTabText(4, UIHelper.translate("Reports"))
-        self.tab_widget.setTabText(5, UIHelper.translate("Settings"))
+        for index, title in enumerate(TAB_TITLES):
+            self.tab_widget.setTabText(index, UIHelper.translate(title))
         
         # Update all widgets with stored original text
         self.update_widget_translations(self)
@@ -141,27 +145,11 @@ class BillTracker(QMainWindow):
                 "OCR functionality requires Mindee API. Please configure your API key to use receipt scanning."
             ))
         
-        # Refresh tables with translated headers
-        if hasattr(self, 'bill_table') and hasattr(self.bill_table, 'property') and self.bill_table.property("original_headers"):
-            headers = self.bill_table.property("original_headers")
-            translated_headers = [UIHelper.translate(header) for header in headers]
-            self.bill_table.setHorizontalHeaderLabels(translated_headers)
-            
-        if hasattr(self, 'present_bill_table') and hasattr(self.present_bill_table, 'property') and self.present_bill_table.property("original_headers"):
-            headers = self.present_bill_table.property("original_headers")
-            translated_headers = [UIHelper.translate(header) for header in headers]
-            self.present_bill_table.setHorizontalHeaderLabels(translated_headers)
-            
-        if hasattr(self, 'delete_table') and hasattr(self.delete_table, 'property') and self.delete_table.property("original_headers"):
-            headers = self.delete_table.property("original_headers")
-            translated_headers = [UIHelper.translate(header) for header in headers]
-            self.delete_table.setHorizontalHeaderLabels(translated_headers)
-            
-        if hasattr(self, 'data_table') and hasattr(self.data_table, 'property') and self.data_table.property("original_headers"):
-            headers = self.data_table.property("original_headers")
-            translated_headers = [UIHelper.translate(header) for header in headers]
-            self.data_table.setHorizontalHeaderLabels(translated_headers)
-            
+        # Refresh tables with translated headers; each model keeps its original headers
+        for model_name in ('bill_model', 'present_bill_model', 'delete_model', 'data_model'):
+            model = getattr(self, model_name, None)
+            if model is not None:
+                model.setHorizontalHeaderLabels([UIHelper.translate(header) for header in model.headers])
 
     def update_scan_button_state(self):
         """Update the scan button state based on OCR availability."""
@@ -261,13 +249,23 @@ class BillTracker(QMainWindow):
         
         # Show image preview
         self.selected_image_path = file_path
-        self.image_preview.setPixmap(QPixmap(file_path))
         
         # If OCR is disabled, just save the image and return
         if not ocr_enabled:
+            self.image_preview.setPixmap(UIHelper.load_scaled_pixmap(file_path, 130))
             self.show_notification(UIHelper.translate("Image scanned and saved (no OCR processing)."), "info")
             return
         
+        # Read the receipt once; the preview and the upload share the bytes
+        try:
+            with open(file_path, 'rb') as file:
+                image_data = file.read()
+        except OSError as e:
+            print(f"Error reading receipt image: {e}")
+            self.show_notification(UIHelper.translate("Failed to read the selected image."), "error")
+            return
+        self.image_preview.setPixmap(UIHelper.load_scaled_pixmap(file_path, 130, image_data))
+        
         # Create and show progress dialog
         progress_dialog = QDialog(self)
         progress_dialog.setWindowTitle(UIHelper.translate("Processing Receipt"))
@@ -285,39 +283,14 @@ class BillTracker(QMainWindow):
         progress_bar.setRange(0, 100)
         layout.addWidget(progress_bar)
         
-        # Create worker thread for OCR processing
-        self.ocr_worker = MindeeWorker(file_path)
-        self.ocr_worker.progress.connect(progress_bar.setValue)
-        self.ocr_worker.finished.connect(lambda results: self.handle_ocr_results(results, progress_dialog))
+        # Process the receipt on the shared thread pool; a second scan gets its own worker
+        worker = MindeeWorker(file_path, image_data)
+        worker.signals.progress.connect(progress_bar.setValue)
+        worker.signals.finished.connect(lambda results: self.handle_ocr_results(results, progress_dialog))
         
         # Show dialog and start worker
         progress_dialog.show()
-        
-        try:
-            self.ocr_worker.start()
-        except Exception as e:
-            # Close the progress dialog
-            progress_dialog.accept()
-            
-            error_msg = str(e)
-            if "API key is not set" in error_msg:
-                # API key not set, prompt user to configure it
-                result = QMessageBox.question(
-                    self, 
-                    UIHelper.translate("API Key Not Set"), 
-                    UIHelper.translate("Mindee API key is not set. Would you like to configure it now?"),
-                    QMessageBox.Yes | QMessageBox.No
-                )
-                
-                if result == QMessageBox.Yes:
-                    self.show_mindee_config_dialog()
-            else:
-                # Other error
-                QMessageBox.critical(
-                    self, 
-                    UIHelper.translate("OCR Error"), 
-                    f"{UIHelper.translate('An error occurred during OCR processing:')} {str(e)}"
-                )
+        QThreadPool.globalInstance().start(worker)
     
     def select_photo(self):
         options = QFileDialog.Options()
@@ -325,7 +298,7 @@ class BillTracker(QMainWindow):
         
         if file_path:
             self.selected_image_path = file_path
-            self.image_preview.setPixmap(QPixmap(file_path))  # Show image preview
+            self.image_preview.setPixmap(UIHelper.load_scaled_pixmap(file_path, 130))  # Show image preview
     
     def handle_ocr_results(self, ocr_results, progress_dialog):
         """Handle the results from the OCR worker."""
@@ -335,7 +308,18 @@ class BillTracker(QMainWindow):
         # Check if there was an error
         if 'error' in ocr_results:
             error_message = ocr_results['error']
-            if "API limit" in error_message or "monthly limit" in error_message:
+            if "API key is not set" in error_message:
+                # API key not set, prompt user to configure it
+                result = QMessageBox.question(
+                    self,
+                    UIHelper.translate("API Key Not Set"),
+                    UIHelper.translate("Mindee API key is not set. Would you like to configure it now?"),
+                    QMessageBox.Yes | QMessageBox.No
+                )
+
+                if result == QMessageBox.Yes:
+                    self.show_mindee_config_dialog()
+            elif "API limit" in error_message or "monthly limit" in error_message:
                 # API limit reached - inform user but still save the image
                 self.show_notification(UIHelper.translate(
                     "Mindee API limit reached. The image was saved but no data was extracted."), 
@@ -363,79 +347,48 @@ class BillTracker(QMainWindow):
         # Update scan button state (API usage may have changed)
         self.update_scan_button_state()
     
-    def show_autocomplete_suggestions(self):
-        query = self.name_input.text()
-        suggestions = self.trie.get_suggestions(query)
-        self.suggestions_list.clear()
-        self.suggestions_list.addItems(suggestions)
-
-    def select_suggestion(self, item):
-        self.name_input.setText(item.text())
-        self.suggestions_list.clear()
-    
     def load_present_bills(self):
-        self.present_bill_table.setRowCount(0)  # Clear the table
-        
         bills = self.db_manager.get_bills()
-        
-        for bill in bills:
-            row_count = self.present_bill_table.rowCount()
-            self.present_bill_table.insertRow(row_count)
-            self.present_bill_table.setItem(row_count, 0, QTableWidgetItem(bill[0]))
-            self.present_bill_table.setItem(row_count, 1, QTableWidgetItem(bill[1]))
-            self.present_bill_table.setItem(row_count, 2, QTableWidgetItem(bill[2]))
+        self.present_bill_model.set_rows(bills)
     
     def load_existing_databases(self):
         """Load existing year-specific databases into the selectors."""
         years = self.db_manager.get_existing_databases()
         
-        # Update all year selectors that exist in the application
-        for year in years:
-            # Update the Print Page year selector (main bills page)
-            if hasattr(self, 'year_selector'):
-                if year not in [self.year_selector.itemText(i) for i in range(self.year_selector.count())]:
-                    self.year_selector.addItem(year)
-            
-            # Update the Data Page year selector
-            if hasattr(self, 'data_year_selector'):
-                if year not in [self.data_year_selector.itemText(i) for i in range(self.data_year_selector.count())]:
-                    self.data_year_selector.addItem(year)
-            
-            # Update the Delete Page year selector
-            if hasattr(self, 'delete_year_selector'):
-                if year not in [self.delete_year_selector.itemText(i) for i in range(self.delete_year_selector.count())]:
-                    self.delete_year_selector.addItem(year)
-                    
-            # Update the Manage Page year selector
-            if hasattr(self, 'manage_year_selector'):
-                if year not in [self.manage_year_selector.itemText(i) for i in range(self.manage_year_selector.count())]:
-                    self.manage_year_selector.addItem(year)
-                    
-            # Update the Photos Page year selector
-            if hasattr(self, 'photos_year_selector'):
-                if year not in [self.photos_year_selector.itemText(i) for i in range(self.photos_year_selector.count())]:
-                    self.photos_year_selector.addItem(year)
+        # Year selectors that exist in the application
+        selectors = [
+            getattr(self, name) for name in (
+                'year_selector',  # Print Page (main bills page)
+                'data_year_selector',  # Data Page
+                'delete_year_selector',  # Delete Page
+                'manage_year_selector',  # Manage Page
+                'photos_year_selector',  # Photos Page
+            ) if hasattr(self, name)
+        ]
+        
+        # Only years not seen before need to be added, in one call per selector.
+        # Appending never moves a selector's current index, so no reload is
+        # triggered, except for an empty selector, which should load its first year
+        new_years = [year for year in years if year not in self._known_years]
+        if not new_years:
+            return
+        self._known_years.update(new_years)
+        for selector in selectors:
+            selector.addItems(new_years)
     
     def load_bills(self):
         """Load bills into the bill table based on the selected year."""
         if not hasattr(self, 'bill_table'):
             return  # Exit early if bill_table doesn't exist yet
             
-        self.bill_table.setRowCount(0)  # Clear the table
-        
         if not hasattr(self, 'year_selector'):
+            self.bill_model.set_rows([])  # Clear the table
             return  # Exit early if year_selector doesn't exist yet
             
         selected_year = self.year_selector.currentText()
         
-        bills = self.db_manager.get_bills(selected_year)
-        
-        for bill in bills:
-            row_count = self.bill_table.rowCount()
-            self.bill_table.insertRow(row_count)
-            self.bill_table.setItem(row_count, 0, QTableWidgetItem(bill[0]))
-            self.bill_table.setItem(row_count, 1, QTableWidgetItem(bill[1]))
-            self.bill_table.setItem(row_count, 2, QTableWidgetItem(bill[2]))
+        bills = self.db_manager.get_bills(selected_year, order=self.bill_sort_order)
+        self.bill_model.set_rows(bills)
     
     def save_bill(self):
         """Save a bill to the database."""
@@ -447,14 +400,7 @@ class BillTracker(QMainWindow):
             return
             
         # Validate date format
-        date = None
-        for date_format in DATE_FORMATS:
-            try:
-                date = datetime.strptime(date_text, date_format).strftime(DATE_FORMAT)
-                break
-            except ValueError:
-                continue
-                
+        date = DateHelper.parse_date(date_text)
         if not date:
             self.show_notification(
                 UIHelper.translate("Invalid date format. Please use MM/dd/yyyy."), 
@@ -491,9 +437,20 @@ class BillTracker(QMainWindow):
             return
 
         # Save the bill using the database manager
-        success = self.db_manager.save_bill(date, name, str(price), self.selected_image_path)
+        # The image is copied on a worker thread so a slow disk doesn't block the UI
+        success = self.db_manager.save_bill(date, name, price, self.selected_image_path, copy_image=False)
         
         if success:
+            if self.selected_image_path:
+                copier = ImageCopier(
+                    self.selected_image_path, self.db_manager.get_image_path(date, name)
+                )
+                copier.signals.failed.connect(partial(self.on_image_copy_failed, date, name))
+                QThreadPool.globalInstance().start(copier)
+            
+            # Suggest the name from now on without rebuilding the trie
+            self.add_name_suggestion(name)
+            
             # Refresh the bill tables
             self.load_bills()
             self.load_present_bills()
@@ -503,8 +460,9 @@ class BillTracker(QMainWindow):
                 self.update_dashboard_stats()
                 self.update_recent_bills_table()
             
-            # Update year selectors after saving
-            self.load_existing_databases()
+            # Update year selectors if the bill started a new year database
+            if str(date.year) not in self._known_years:
+                self.load_existing_databases()
             
             # Clear selected categories and inputs
             self.selected_categories = []
@@ -529,18 +487,19 @@ class BillTracker(QMainWindow):
                 "error"
             )
     
-    def create_table_in_db(self, conn):
-        query = """
-        CREATE TABLE IF NOT EXISTS bills (
-            id INTEGER PRIMARY KEY,
-            date TEXT,
-            name TEXT,
-            price TEXT,
-            image TEXT -- stores  the image filename
-        )
+    def on_image_copy_failed(self, date, name, error):
+        """Drop the image from a saved bill whose image could not be copied, and tell the user.
+        
+        Args:
+            date: The date of the bill as a datetime
+            name: The name of the bill
+            error: The error message from the copy
         """
-        conn.execute(query)
-        conn.commit()
+        self.db_manager.clear_bill_image(date, name)
+        self.show_notification(
+            UIHelper.translate("Bill saved, but its image could not be copied.") + f": {error}",
+            "error"
+        )
     
     def add_category(self, category):
         if category in self.selected_categories:
@@ -552,7 +511,7 @@ class BillTracker(QMainWindow):
     def update_name_input(self):
         current_text = self.name_input.text().split('(')[0].strip()
         # Sort selected categories based on predefined order
-        sorted_categories = sorted(self.selected_categories, key=lambda x: self.predefined_order.index(x))
+        sorted_categories = sorted(self.selected_categories, key=self._category_rank.__getitem__)
         categories_text = ' '.join(f'({cat})' for cat in sorted_categories)
         self.name_input.setText(f"{current_text} {categories_text}".strip())
     
@@ -560,6 +519,7 @@ class BillTracker(QMainWindow):
         new_category = self.new_category_input.text()
         if new_category and new_category not in self.categories:
             self.categories.append(new_category)
+            self.update_category_rank()
             
             # Create a button without translation marking
             button = QPushButton(new_category)
@@ -578,12 +538,17 @@ class BillTracker(QMainWindow):
     def delete_category(self, category):
         if category in self.categories:
             self.categories.remove(category)
+            self.update_category_rank()
             button = self.category_buttons.pop(category)
             self.category_layout.removeWidget(button)
             button.deleteLater()
             self.save_categories()
             self.update_settings_page()  # No longer modifying category_order
     
+    def update_category_rank(self):
+        """Rebuild the category -> position lookup used to order selected categories."""
+        self._category_rank = {category: i for i, category in enumerate(self.predefined_order)}
+    
     def update_settings_page(self):
         """Update the settings page category list."""
         self.clear_layout(self.category_list_layout)
@@ -604,13 +569,24 @@ class BillTracker(QMainWindow):
             self.category_list_layout.addLayout(category_layout)
     
     def clear_layout(self, layout):
-        """Recursively clear a layout and its child widgets/layouts."""
-        while layout.count():
-            item = layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-            elif item.layout():
-                self.clear_layout(item.layout())
+        """Clear a layout and its nested child widgets/layouts."""
+        parent = layout.parentWidget()
+        if parent:
+            parent.setUpdatesEnabled(False)  # Repaint once after all removals
+        
+        # Walk nested layouts with an explicit stack instead of recursion
+        stack = [layout]
+        while stack:
+            current = stack.pop()
+            while current.count():
+                item = current.takeAt(current.count() - 1)
+                if item.widget():
+                    item.widget().deleteLater()
+                elif item.layout():
+                    stack.append(item.layout())
+        
+        if parent:
+            parent.setUpdatesEnabled(True)
 
     def load_categories(self):
         """Load categories from the settings manager."""
@@ -622,28 +598,30 @@ class BillTracker(QMainWindow):
     
     def load_data(self):
         """Load monthly expenditure data based on the selected year."""
-        self.data_table.setRowCount(0)  # Clear the table
         selected_year = self.data_year_selector.currentText()
         
         # Get monthly and yearly totals
         monthly_totals, yearly_totals = self.db_manager.get_monthly_totals(selected_year)
         
-        # Populate the data table with monthly totals
-        for month in range(1, 13):
-            row_count = self.data_table.rowCount()
-            self.data_table.insertRow(row_count)
-            self.data_table.setItem(row_count, 0, QTableWidgetItem(datetime(1900, month, 1).strftime("%B")))  # Month name
-            self.data_table.setItem(row_count, 1, QTableWidgetItem(f"${monthly_totals[month]['cash']:.2f}"))
-            self.data_table.setItem(row_count, 2, QTableWidgetItem(f"${monthly_totals[month]['not_cash']:.2f}"))
-            self.data_table.setItem(row_count, 3, QTableWidgetItem(f"${monthly_totals[month]['total']:.2f}"))
-        
-        # Add yearly totals as the last row
-        row_count = self.data_table.rowCount()
-        self.data_table.insertRow(row_count)
-        self.data_table.setItem(row_count, 0, QTableWidgetItem("Year Total"))
-        self.data_table.setItem(row_count, 1, QTableWidgetItem(f"${yearly_totals['cash']:.2f}"))
-        self.data_table.setItem(row_count, 2, QTableWidgetItem(f"${yearly_totals['not_cash']:.2f}"))
-        self.data_table.setItem(row_count, 3, QTableWidgetItem(f"${yearly_totals['total']:.2f}"))
+        # Build one row per month, plus the yearly totals as the last row
+        format_price = UIHelper.format_price
+        rows = []
+        for month, month_name in enumerate(MONTH_NAMES, start=1):
+            totals = monthly_totals[month]
+            rows.append((
+                month_name,
+                format_price(totals['cash']),
+                format_price(totals['not_cash']),
+                format_price(totals['total'])
+            ))
+        rows.append((
+            "Year Total",
+            format_price(yearly_totals['cash']),
+            format_price(yearly_totals['not_cash']),
+            format_price(yearly_totals['total'])
+        ))
+        
+        self.data_model.set_rows(rows)
 
     def print_bills(self):
         # Create a printer object
@@ -687,15 +665,11 @@ class BillTracker(QMainWindow):
         painter.setFont(font)  # Apply the font to the painter
 
         # Render table content (filtered rows only)
-        for row in range(self.bill_table.rowCount()):
+        for date, name, price in self.bill_model.rows():
             if y + 20 > page_rect.height() - margin:
                 printer.newPage()
                 y = margin  # Reset y for the new page
 
-            date = self.bill_table.item(row, 0).text()
-            name = self.bill_table.item(row, 1).text()
-            price = self.bill_table.item(row, 2).text()
-
             painter.drawText(x, y, date)
             painter.drawText(x + 525, y, name)
             painter.drawText(x + 4250, y, price)
@@ -725,22 +699,17 @@ class BillTracker(QMainWindow):
             return
             
         # Load bills within the date range
-        self.bill_table.setRowCount(0)  # Clear the table
         selected_year = self.year_selector.currentText()
         
         bills = self.db_manager.get_bills(
             selected_year, 
             start_date, 
-            end_date
+            end_date,
+            self.bill_sort_order
         )
         
         # Populate the table with the filtered bills
-        for bill in bills:
-            row_count = self.bill_table.rowCount()
-            self.bill_table.insertRow(row_count)
-            self.bill_table.setItem(row_count, 0, QTableWidgetItem(bill[0]))
-            self.bill_table.setItem(row_count, 1, QTableWidgetItem(bill[1]))
-            self.bill_table.setItem(row_count, 2, QTableWidgetItem(bill[2]))
+        self.bill_model.set_rows(bills)
 
     def init_delete_page(self):
         """Initialize the Delete Page tab for removing bills."""
@@ -797,10 +766,7 @@ class BillTracker(QMainWindow):
 
         # Database selection dropdown
         self.delete_year_selector = QComboBox()
-        for i in range(self.year_selector.count()):
-            year = self.year_selector.itemText(i)
-            if year != "Present Database":
-                self.delete_year_selector.addItem(year)
+        self.delete_year_selector.addItems(sorted(self._known_years))
         self.delete_year_selector.currentIndexChanged.connect(self.load_delete_table)
         self.delete_layout.addWidget(self.delete_year_selector)
         
@@ -810,101 +776,61 @@ class BillTracker(QMainWindow):
         self.delete_layout.addWidget(UIHelper.create_section_label("Bills"))
 
         # Table to display bills
-        self.delete_table = UIHelper.create_table(3, ["Date", "Name", "Price"])
+        self.delete_table = UIHelper.create_table_view(["Date", "Name", "Price"])
+        self.delete_model = self.delete_table.model()
         self.delete_layout.addWidget(self.delete_table)
 
     def load_delete_table(self):
-        self.delete_table.setRowCount(0)
         selected_year = self.delete_year_selector.currentText()
-        conn = sqlite3.connect(f"bills_{selected_year}.db")
-        cursor = conn.execute("SELECT date, name, price FROM bills")
-        for row in cursor:
-            row_count = self.delete_table.rowCount()
-            self.delete_table.insertRow(row_count)
-            self.delete_table.setItem(row_count, 0, QTableWidgetItem(row[0]))
-            self.delete_table.setItem(row_count, 1, QTableWidgetItem(row[1]))
-            self.delete_table.setItem(row_count, 2, QTableWidgetItem(row[2]))
-        conn.close()
+        self.delete_model.set_rows(self.db_manager.get_bills(selected_year, order=self.delete_sort_order))
 
     def search_by_date(self):
-        try:
-            date_formats = ["%m/%d/%y", "%m/%d/%Y"]
-            
-            def parse_date(date_text):
-                for date_format in date_formats:
-                    try:
-                        return datetime.strptime(date_text, date_format).strftime("%m/%d/%Y")
-                    except ValueError:
-                        continue
-                raise ValueError("Invalid date format")
-            
-            date_text = parse_date(self.search_input.text())
-
-            # Convert the text inputs to datetime objects
-            date = datetime.strptime(date_text, "%m/%d/%Y")
-        except ValueError as e:
-            # If invalid date or conversion error occurs, show all entries in the database        
-            # Load all bills (no filtering)
+        date = DateHelper.parse_date(self.search_input.text())
+        if not date:
             QMessageBox.warning(self, "Input Error", "Invalid date format. Please use MM/dd/yyyy.")
             return
 
-        self.delete_table.setRowCount(0)
         selected_year = self.delete_year_selector.currentText()
-        conn = sqlite3.connect(f"bills_{selected_year}.db")
-        cursor = conn.execute("SELECT date, name, price FROM bills WHERE date = ?", (date.strftime("%m/%d/%Y"),))
-        for row in cursor:
-            row_count = self.delete_table.rowCount()
-            self.delete_table.insertRow(row_count)
-            self.delete_table.setItem(row_count, 0, QTableWidgetItem(row[0]))
-            self.delete_table.setItem(row_count, 1, QTableWidgetItem(row[1]))
-            self.delete_table.setItem(row_count, 2, QTableWidgetItem(row[2]))
-        conn.close()
+        self.delete_model.set_rows(self.db_manager.get_bills(selected_year, date, date, self.delete_sort_order))
 
     def delete_selected_row(self):
-        """Delete the selected row from the database."""
-        selected_row = self.delete_table.currentRow()
-        if selected_row < 0:
+        """Delete the selected rows from the database."""
+        # Highest row first, so removing a row doesn't shift the ones still to remove
+        selected_rows = sorted(
+            {index.row() for index in self.delete_table.selectionModel().selectedRows()},
+            reverse=True
+        )
+        if not selected_rows:
             QMessageBox.warning(self, UIHelper.translate("Selection Error"), 
                                UIHelper.translate("No row selected."))
             return
             
-        date = self.delete_table.item(selected_row, 0).text()
-        name = self.delete_table.item(selected_row, 1).text()
-        price = self.delete_table.item(selected_row, 2).text()
+        bills = [self.delete_model.row(row) for row in selected_rows]
         
         selected_year = self.delete_year_selector.currentText()
         
-        # Delete the bill using the database manager
-        success = self.db_manager.delete_bill(selected_year, date, name, price)
+        # Delete all selected bills in one transaction
+        success = self.db_manager.delete_bills(selected_year, bills)
         
         if success:
-            self.delete_table.removeRow(selected_row)
+            for row in selected_rows:
+                self.delete_model.remove_row(row)
         else:
             QMessageBox.critical(self, UIHelper.translate("Error"), 
                                 UIHelper.translate("Failed to delete bill. Please try again."))
 
     def sort_delete_table(self, order):
-        rows = []
-        for row in range(self.delete_table.rowCount()):
-            date_item = self.delete_table.item(row, 0)
-            name_item = self.delete_table.item(row, 1)
-            price_item = self.delete_table.item(row, 2)
-
-            if date_item and name_item and price_item:
-                date = datetime.strptime(date_item.text(), "%m/%d/%Y")
-                price = float(price_item.text().replace("$", ""))
-                name = name_item.text()
-                rows.append((date, price, name, row))
-
-        rows.sort(key=lambda x: (x[0], -x[1], x[2]), reverse=order == "desc")
+        """Reload the delete table sorted by date in the given order."""
+        self.delete_sort_order = order
+        if self.search_input.text():
+            self.search_by_date()
+        else:
+            self.load_delete_table()
 
-        self.delete_table.setRowCount(0)
-        for date, price, name, _ in rows:
-            row_count = self.delete_table.rowCount()
-            self.delete_table.insertRow(row_count)
-            self.delete_table.setItem(row_count, 0, QTableWidgetItem(date.strftime("%m/%d/%Y")))
-            self.delete_table.setItem(row_count, 1, QTableWidgetItem(name))
-            self.delete_table.setItem(row_count, 2, QTableWidgetItem(f"${price:.2f}"))
+    def sort_table(self, order):
+        """Reload the bill table sorted by date, then by price (highest first) and name."""
+        self.bill_sort_order = order
+        self.filter_by_date_range()  # Falls back to load_bills without a date range
 
     def update_widget_translations(self, parent_widget):
         """Recursively update translations of all child widgets.
@@ -930,16 +856,34 @@ class BillTracker(QMainWindow):
                 self.update_widget_translations(child)
 
     def load_names_into_trie(self):
-        # Load names from unique_names.json and insert them into the trie
-        try:
-            with open('unique_names.json', 'r') as file:
-                names = json.load(file)
-            for name in names:
-                self.trie.insert(name)
-        except FileNotFoundError:
-            # Create the file if it doesn't exist
-            with open('unique_names.json', 'w') as file:
-                json.dump([], file)
+        """Build the name trie from unique_names.json on a worker thread."""
+        self.trie_loader = TrieLoader()
+        self.trie_loader.loaded.connect(self.on_trie_loaded)
+        self.trie_loader.start()
+
+    def on_trie_loaded(self, trie):
+        """Start using the trie built by the worker thread."""
+        self.trie = trie
+        self.trie_ready = True
+        self.suggestion_query = None  # Earlier lookups ran before the names were loaded
+        for name in self.pending_names:
+            self.add_name_suggestion(name)
+        self.pending_names = []
+        if self.name_input.text():
+            self.suggestion_timer.start()
+
+    def add_name_suggestion(self, name):
+        """Add a bill name to the loaded trie, unless it is already suggested.
+        
+        Args:
+            name: The bill name
+        """
+        if not self.trie_ready:
+            self.pending_names.append(name)  # Added once the trie has loaded
+            return
+        if not self.trie.contains(name):
+            self.trie.insert(name)
+            self.suggestion_query = None  # The remembered results may be missing the name
 
     def init_print_page(self):
         """Initialize the Print Page tab with filter and display options."""
@@ -1005,6 +949,7 @@ class BillTracker(QMainWindow):
         # Database selection dropdown
         self.year_selector = QComboBox()
         self.year_selector.addItem("Present Database")
+        self.year_selector.addItems(sorted(self._known_years))
         self.year_selector.currentIndexChanged.connect(self.load_bills)
         self.print_layout.addWidget(self.year_selector)
         
@@ -1014,36 +959,50 @@ class BillTracker(QMainWindow):
         self.print_layout.addWidget(UIHelper.create_section_label("Bills"))
         
         # Table to display bills
-        self.bill_table = UIHelper.create_table(3, ["Date", "Name", "Price"])
+        self.bill_table = UIHelper.create_table_view(["Date", "Name", "Price"])
+        self.bill_model = self.bill_table.model()
         self.print_layout.addWidget(self.bill_table)
     
     def show_autocomplete_suggestions(self):
         """Show autocomplete suggestions for bill names."""
         query = self.name_input.text()
         
-        if len(query) < 2:
-            self.suggestions_list.clear()
-            self.suggestions_list.setFixedHeight(0)  # Hide when not needed
+        if len(query) < 2 or not self.trie_ready:
+            self.hide_suggestions()
             return
             
-        suggestions = self.trie.get_suggestions(query)
+        # Repeated text (e.g. retyping after a deletion) reuses the last lookup
+        if query != self.suggestion_query:
+            self.suggestion_query = query
+            self.suggestion_results = self.trie.get_suggestions(query)
+        suggestions = self.suggestion_results
         
         if suggestions:
-            self.suggestions_list.clear()
-            self.suggestions_list.addItems(suggestions)
+            # Only reset the model when the suggestions actually changed
+            if suggestions != self.suggestions_model.stringList():
+                self.suggestions_model.setStringList(suggestions)
             # Adjust height based on number of suggestions (up to 5 visible)
             item_height = 25
             suggestion_count = min(5, len(suggestions))
             self.suggestions_list.setFixedHeight(suggestion_count * item_height)
         else:
-            self.suggestions_list.clear()
-            self.suggestions_list.setFixedHeight(0)  # Hide when no suggestions
+            self.hide_suggestions()
     
-    def select_suggestion(self, item):
-        """Select a suggestion from the autocomplete list."""
-        self.name_input.setText(item.text())
-        self.suggestions_list.clear()
-        self.suggestions_list.setFixedHeight(0)  # Hide after selection
+    def hide_suggestions(self):
+        """Empty and collapse the autocomplete list."""
+        if self.suggestions_model.rowCount():
+            self.suggestions_model.setStringList([])
+        self.suggestions_list.setFixedHeight(0)
+    
+    def select_suggestion(self, index):
+        """Select a suggestion from the autocomplete list.
+        
+        Args:
+            index: Model index of the clicked suggestion
+        """
+        self.name_input.setText(index.data())
+        self.suggestion_timer.stop()  # Don't reopen the list for the selected text
+        self.hide_suggestions()
     
     def toggle_category(self, category, checked):
         """Toggle a category on or off."""
@@ -1088,8 +1047,6 @@ class BillTracker(QMainWindow):
             
         # If on dashboard, update the recent bills table with search results
         if self.tab_widget.currentIndex() == 0:
-            self.recent_bills_table.setRowCount(0)
-            
             # Search in all years
             all_bills = []
             years = self.db_manager.get_existing_databases()
@@ -1110,14 +1067,7 @@ class BillTracker(QMainWindow):
                              search_text in bill[2].lower()]    # Price
             
             # Add filtered bills to table (limit to 10)
-            max_bills = min(10, len(filtered_bills))
-            for i in range(max_bills):
-                bill = filtered_bills[i]
-                row_count = self.recent_bills_table.rowCount()
-                self.recent_bills_table.insertRow(row_count)
-                self.recent_bills_table.setItem(row_count, 0, QTableWidgetItem(bill[0]))
-                self.recent_bills_table.setItem(row_count, 1, QTableWidgetItem(bill[1]))
-                self.recent_bills_table.setItem(row_count, 2, QTableWidgetItem(bill[2]))
+            UIHelper.populate_table(self.recent_bills_table, filtered_bills[:10])
 
     def init_notification_system(self):
         """Initialize the notification system for user feedback."""
@@ -1170,6 +1120,13 @@ class BillTracker(QMainWindow):
         self.notification_area.setFixedHeight(0)
         self.notification_timer.stop()
     
+    def closeEvent(self, event):
+        """Finish background loading and close database connections when the window closes."""
+        self.trie_loader.wait()  # The thread must not outlive the window
+        QThreadPool.globalInstance().waitForDone()  # Let pending image copies finish
+        self.db_manager.close()
+        super().closeEvent(event)
+    
     def on_manage_tab_changed(self, index):
         """Handle changing between Bills and Photos tabs."""
         if index == 0:  # Bills tab
@@ -1179,21 +1136,15 @@ class BillTracker(QMainWindow):
     
     def load_manage_bills(self):
         """Load bills into the manage bills table."""
-        self.manage_bills_table.setRowCount(0)
         selected_year = self.manage_year_selector.currentText()
         
         bills = self.db_manager.get_bills(selected_year)
+        UIHelper.populate_table(self.manage_bills_table, bills)
         
-        for bill in bills:
-            row_count = self.manage_bills_table.rowCount()
-            self.manage_bills_table.insertRow(row_count)
-            self.manage_bills_table.setItem(row_count, 0, QTableWidgetItem(bill[0]))
-            self.manage_bills_table.setItem(row_count, 1, QTableWidgetItem(bill[1]))
-            self.manage_bills_table.setItem(row_count, 2, QTableWidgetItem(bill[2]))
-            
+        for row in range(len(bills)):
             # Add checkbox for selection
             checkbox = QCheckBox()
-            self.manage_bills_table.setCellWidget(row_count, 3, checkbox)
+            self.manage_bills_table.setCellWidget(row, 3, checkbox)
     
     def filter_manage_bills(self):
         """Filter bills in the manage view by date range and category."""
@@ -1220,17 +1171,11 @@ class BillTracker(QMainWindow):
             bills = [bill for bill in bills if f"({selected_category})" in bill[1]]
         
         # Update table
-        self.manage_bills_table.setRowCount(0)
-        for bill in bills:
-            row_count = self.manage_bills_table.rowCount()
-            self.manage_bills_table.insertRow(row_count)
-            self.manage_bills_table.setItem(row_count, 0, QTableWidgetItem(bill[0]))
-            self.manage_bills_table.setItem(row_count, 1, QTableWidgetItem(bill[1]))
-            self.manage_bills_table.setItem(row_count, 2, QTableWidgetItem(bill[2]))
-            
+        UIHelper.populate_table(self.manage_bills_table, bills)
+        for row in range(len(bills)):
             # Add checkbox for selection
             checkbox = QCheckBox()
-            self.manage_bills_table.setCellWidget(row_count, 3, checkbox)
+            self.manage_bills_table.setCellWidget(row, 3, checkbox)
     
     def delete_selected_bills(self):
         """Delete bills selected with checkboxes."""
@@ -1262,15 +1207,16 @@ class BillTracker(QMainWindow):
         deleted_count = 0
         
         # Delete in reverse order to avoid index shifting
-        for row in sorted(selected_rows, reverse=True):
-            date = self.manage_bills_table.item(row, 0).text()
-            name = self.manage_bills_table.item(row, 1).text()
-            price = self.manage_bills_table.item(row, 2).text()
-            
-            success = self.db_manager.delete_bill(selected_year, date, name, price)
-            
-            if success:
-                deleted_count += 1
+        selected_rows.sort(reverse=True)
+        bills = [
+            tuple(self.manage_bills_table.item(row, column).text() for column in range(3))
+            for row in selected_rows
+        ]
+        
+        # Delete all selected bills in one transaction
+        if self.db_manager.delete_bills(selected_year, bills):
+            deleted_count = len(selected_rows)
+            for row in selected_rows:
                 self.manage_bills_table.removeRow(row)
             
         # Show success notification
@@ -1305,11 +1251,12 @@ class BillTracker(QMainWindow):
         # Add images to the grid
         row, col = 0, 0
         max_cols = 3  # Show 3 photos per row
+        existing_images = self.db_manager.get_existing_images()
         
         for date, image_filename in bill_images:
             if image_filename:
                 image_path = os.path.join("bill_images", image_filename)
-                if os.path.exists(image_path):
+                if image_filename in existing_images:
                     # Create a card for each photo
                     photo_card = QWidget()
                     photo_card.setObjectName("photo-card")
@@ -1323,8 +1270,7 @@ class BillTracker(QMainWindow):
                     
                     # Add image
                     image_label = QLabel()
-                    pixmap = QPixmap(image_path)
-                    image_label.setPixmap(pixmap.scaled(250, 250, Qt.KeepAspectRatio))
+                    image_label.setPixmap(UIHelper.load_scaled_pixmap(image_path, 250))
                     image_label.setAlignment(Qt.AlignCenter)
                     card_layout.addWidget(image_label)
                     
@@ -1366,11 +1312,12 @@ class BillTracker(QMainWindow):
             # Add images to the grid
             row, col = 0, 0
             max_cols = 3
+            existing_images = self.db_manager.get_existing_images()
             
             for date, image_filename in bill_images:
                 if image_filename:
                     image_path = os.path.join("bill_images", image_filename)
-                    if os.path.exists(image_path):
+                    if image_filename in existing_images:
                         # Create a card for each photo
                         photo_card = QWidget()
                         photo_card.setObjectName("photo-card")
@@ -1384,8 +1331,7 @@ class BillTracker(QMainWindow):
                         
                         # Add image
                         image_label = QLabel()
-                        pixmap = QPixmap(image_path)
-                        image_label.setPixmap(pixmap.scaled(250, 250, Qt.KeepAspectRatio))
+                        image_label.setPixmap(UIHelper.load_scaled_pixmap(image_path, 250))
                         image_label.setAlignment(Qt.AlignCenter)
                         card_layout.addWidget(image_label)
                         
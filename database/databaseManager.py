@@ -1,10 +1,79 @@
-from datetime import datetime
+from collections import OrderedDict, defaultdict
 import os
+import re
 import shutil
 import sqlite3
+import uuid
+
+from util.dateHelper import DateHelper
 
 DATE_FORMAT = "%m/%d/%Y"
-DATE_FORMATS = ["%m/%d/%y", "%m/%d/%Y"]
+ISO_DATE_FORMAT = "%Y-%m-%d"
+
+# Version stored in PRAGMA user_version once all migrations have run
+SCHEMA_VERSION = 4
+
+CREATE_BILLS_TABLE = """
+CREATE TABLE IF NOT EXISTS bills (
+    id INTEGER PRIMARY KEY,
+    date TEXT,
+    name TEXT,
+    price_cents INTEGER,
+    image TEXT,
+    is_cash INTEGER NOT NULL DEFAULT 0
+)
+"""
+CREATE_DATE_INDEX = "CREATE INDEX IF NOT EXISTS idx_bills_date ON bills(date)"
+# Partial index matching the photo queries' "image IS NOT NULL" predicate
+CREATE_IMAGE_DATE_INDEX = "CREATE INDEX IF NOT EXISTS idx_bills_image_date ON bills(date) WHERE image IS NOT NULL"
+INSERT_BILL = "INSERT INTO {schema}.bills (date, name, price_cents, image, is_cash) VALUES (?, ?, ?, ?, ?)"
+
+# Dates are stored as ISO YYYY-MM-DD so they sort and compare chronologically;
+# this expression turns them back into MM/DD/YYYY for display.
+DISPLAY_DATE = "substr(date, 6, 2) || '/' || substr(date, 9, 2) || '/' || substr(date, 1, 4)"
+# Prices are stored as whole cents; this expression formats them as $X.YZ for display.
+DISPLAY_PRICE = "printf('$%.2f', price_cents / 100.0)"
+
+# ORDER BY clauses for sorted bill lists: by date, then by price (highest first) and name
+ORDER_BY = {
+    "asc": " ORDER BY date ASC, price_cents DESC, name",
+    "desc": " ORDER BY date DESC, price_cents DESC, name",
+}
+
+# Queries are built once so every call hands sqlite3 the same SQL text, which
+# lets its per-connection statement cache reuse the compiled statement
+SELECT_BILLS = f"SELECT {DISPLAY_DATE}, name, {DISPLAY_PRICE} FROM bills"
+SELECT_BILLS_BETWEEN = SELECT_BILLS + " WHERE date BETWEEN ? AND ?"
+SELECT_BILLS_QUERIES = {
+    (ranged, order): (SELECT_BILLS_BETWEEN if ranged else SELECT_BILLS) + ORDER_BY.get(order, "")
+    for ranged in (False, True)
+    for order in (None, "asc", "desc")
+}
+SELECT_BILL_IMAGES = f"SELECT {DISPLAY_DATE}, image FROM bills WHERE image IS NOT NULL"
+SELECT_BILL_IMAGES_BETWEEN = SELECT_BILL_IMAGES + " AND date BETWEEN ? AND ?"
+DELETE_BILL = "DELETE FROM bills WHERE date = ? AND name = ? AND price_cents = ?"
+# Drop the image of the newest bill stored with it; earlier bills keep theirs
+CLEAR_BILL_IMAGE = """
+UPDATE {schema}.bills SET image = NULL
+WHERE id = (SELECT MAX(id) FROM {schema}.bills WHERE image = ?)
+"""
+# Sum cash and non-cash prices per month (month taken from YYYY-MM-DD), in dollars
+SELECT_MONTHLY_TOTALS = """
+SELECT CAST(substr(date, 6, 2) AS INTEGER) AS month,
+       TOTAL(CASE WHEN is_cash THEN price_cents END) / 100.0,
+       TOTAL(CASE WHEN NOT is_cash THEN price_cents END) / 100.0
+FROM bills
+GROUP BY month
+"""
+
+# Year-specific database files, e.g. bills_2025.db
+DATABASE_FILE_PATTERN = re.compile(r"bills_[0-9]{4}\.db")
+
+# Number of get_bills results kept for repeated queries
+BILL_CACHE_SIZE = 32
+
+# Number of year-specific databases kept open at once
+YEAR_CONNECTION_LIMIT = 4
 
 class DatabaseManager:
     """Handles all database operations for the bill tracker application."""
@@ -12,21 +81,17 @@ class DatabaseManager:
     def __init__(self):
         """Initialize the database manager with an in-memory database."""
         self.conn = sqlite3.connect(':memory:')  # In-memory database for current session
+        self.conn.execute("PRAGMA temp_store=MEMORY")  # Keep ORDER BY sorts off temp files
+        self.year_connections = OrderedDict()  # Open year-specific databases, least recently used first
+        self.attached_years = set()  # Year-specific databases attached to self.conn
+        self.bill_cache = OrderedDict()  # Recent get_bills results, least recently used first
+        self.database_listing = None  # (folder mtime, years) from the last database scan
+        self.image_listing = None  # (folder mtime, filenames) from the last bill_images scan
         self.create_tables()
     
     def create_tables(self):
         """Create the necessary tables if they don't exist."""
-        query = """
-        CREATE TABLE IF NOT EXISTS bills (
-            id INTEGER PRIMARY KEY,
-            date TEXT,
-            name TEXT,
-            price TEXT,
-            image TEXT
-        )
-        """
-        self.conn.execute(query)
-        self.conn.commit()
+        self.create_tables_in_db(self.conn)
     
     def get_db_connection(self, year=None):
         """Get a database connection based on the year.
@@ -39,103 +104,304 @@ class DatabaseManager:
         """
         if year is None or year == "Present Database":
             return self.conn
+        
+        year = str(year)
+        conn = self.year_connections.get(year)
+        if conn is None:
+            conn = self.connect_year_database(year)
+            self.year_connections[year] = conn
+            if len(self.year_connections) > YEAR_CONNECTION_LIMIT:
+                # Each connection holds its own page cache, so only recent years stay open
+                _, oldest = self.year_connections.popitem(last=False)
+                oldest.close()
         else:
-            db_name = f"bills_{year}.db"
-            conn = sqlite3.connect(db_name)
-            # Ensure the table exists in the year-specific database
-            query = """
-            CREATE TABLE IF NOT EXISTS bills (
-                id INTEGER PRIMARY KEY,
-                date TEXT,
-                name TEXT,
-                price TEXT,
-                image TEXT
-            )
-            """
-            conn.execute(query)
-            conn.commit()
-            return conn
+            self.year_connections.move_to_end(year)
+        return conn
+    
+    def get_cache_year(self, year):
+        """Get the key a year's cached results are stored under.
+        
+        Args:
+            year: The year as passed to get_db_connection.
+            
+        Returns:
+            str: The year as a string, or None for the in-memory database.
+        """
+        if year is None or year == "Present Database":
+            return None
+        return str(year)
+    
+    def invalidate_bill_cache(self, year):
+        """Drop cached get_bills results for a database that was written to.
+        
+        Args:
+            year: The year of the database, or None for the in-memory database.
+        """
+        year = self.get_cache_year(year)
+        for key in [key for key in self.bill_cache if key[0] == year]:
+            del self.bill_cache[key]
+    
+    def connect_year_database(self, year):
+        """Open a year-specific database and make sure it is ready for use.
+        
+        The database is switched to WAL journaling with synchronous=NORMAL so
+        a commit is a single append instead of a rollback-journal fsync, and
+        gets a larger page cache that lives as long as the cached connection.
+        Reads go through a memory map, which saves copying pages into that cache.
+        
+        Args:
+            year: The year of the database to open.
+            
+        Returns:
+            sqlite3.Connection: The database connection.
+        """
+        conn = sqlite3.connect(f"bills_{year}.db")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+        conn.execute("PRAGMA temp_store=MEMORY")  # Sorts and temp b-trees stay in RAM
+        conn.execute("PRAGMA mmap_size=268435456")  # Read pages through a 256 MB memory map
+        # Ensure the table exists in the year-specific database
+        self.create_tables_in_db(conn)
+        return conn
+    
+    def attach_year_database(self, year):
+        """Attach a year-specific database to the in-memory connection.
+        
+        Writes can then reach the in-memory and yearly tables in one transaction.
+        
+        Args:
+            year: The year of the database to attach.
+            
+        Returns:
+            str: The schema name the database is attached as.
+        """
+        year = str(year)
+        schema = f"yearly_{year}"
+        if year not in self.attached_years:
+            # Opening it first creates and migrates the file if needed
+            self.get_db_connection(year)
+            self.conn.execute(f"ATTACH DATABASE ? AS {schema}", (f"bills_{year}.db",))
+            self.conn.execute(f"PRAGMA {schema}.synchronous=NORMAL")
+            self.attached_years.add(year)
+        return schema
     
-    def save_bill(self, date, name, price, image_path=None):
+    def save_bill(self, date, name, price, image_path=None, copy_image=True):
         """Save a bill to both the year-specific database and in-memory database.
         
         Args:
-            date: The date of the bill.
+            date: The date of the bill as a datetime.
             name: The name of the bill.
-            price: The price of the bill.
+            price: The price of the bill as a float.
             image_path: The path to the bill's image, if any.
+            copy_image: Whether to copy the image into bill_images here. Pass False
+                when the caller copies it to get_image_path(date, name) itself.
             
         Returns:
             bool: True if successful, False otherwise.
         """
-        try:
-            # Format the price as currency
-            formatted_price = f"${float(price):.2f}"
-            
-            # Determine the year for the database
-            year = datetime.strptime(date, DATE_FORMAT).year
-            db_name = f"bills_{year}.db"
-            
-            # Save to year-specific database
-            conn = sqlite3.connect(db_name)
-            self.create_tables_in_db(conn)
-            
-            # Save to the year-specific database
-            query = "INSERT INTO bills (date, name, price) VALUES (?, ?, ?)"
-            conn.execute(query, (date, name, formatted_price))
-            conn.commit()
-            conn.close()
+        return self.save_bills([(date, name, price, image_path)], copy_image)
+    
+    def save_bills(self, bills, copy_images=True):
+        """Save several bills, writing each database with a single executemany.
+        
+        Args:
+            bills: Iterable of (date, name, price, image_path) tuples, with date as a
+                datetime and price as a float.
+            copy_images: Whether to copy the images into bill_images here.
             
-            # Save to the in-memory database
-            self.conn.execute(query, (date, name, formatted_price))
-            self.conn.commit()
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        try:
+            rows_by_year = defaultdict(list)
+            all_rows = []
             
-            # Handle image if provided
-            image_filename = None
-            if image_path:
-                image_folder = "bill_images"
-                os.makedirs(image_folder, exist_ok=True)
-                image_filename = f"{date.replace('/', '-')}_{name}.jpg"
-                dest_path = os.path.join(image_folder, image_filename)
-                shutil.copy(image_path, dest_path)
+            for date, name, price, image_path in bills:
+                # Store the price as whole cents, so sums and comparisons are exact
+                price_cents = round(price * 100)
                 
-                # Update the database with the image filename
-                update_query = "UPDATE bills SET image = ? WHERE date = ? AND name = ? AND price = ?"
-                self.conn.execute(update_query, (image_filename, date, name, formatted_price))
-                self.conn.commit()
+                # Determine the year for the database
+                year = date.year
                 
-                # Also update the year-specific database
-                conn = sqlite3.connect(db_name)
-                conn.execute(update_query, (image_filename, date, name, formatted_price))
-                conn.commit()
-                conn.close()
+                # Copy the image first so the row can be written with its filename in one INSERT
+                image_filename = None
+                if image_path:
+                    dest_path = self.get_image_path(date, name)
+                    image_filename = os.path.basename(dest_path)
+                    if copy_images:
+                        self.copy_image(image_path, dest_path)
                 
+                # Classify the bill once here instead of matching the name in every total
+                is_cash = "Cash" in name
+                row = (date.strftime(ISO_DATE_FORMAT), name, price_cents, image_filename, is_cash)
+                rows_by_year[year].append(row)
+                all_rows.append(row)
+            
+            # ATTACH cannot run inside a transaction, so attach every year first
+            schemas = {year: self.attach_year_database(year) for year in rows_by_year}
+            
+            # Save to the year-specific and in-memory databases in one transaction
+            with self.conn:
+                for year, rows in rows_by_year.items():
+                    self.conn.executemany(INSERT_BILL.format(schema=schemas[year]), rows)
+                self.conn.executemany(INSERT_BILL.format(schema="main"), all_rows)
+            
+            for year in rows_by_year:
+                self.invalidate_bill_cache(year)
+            self.invalidate_bill_cache(None)
             return True
         except Exception as e:
             print(f"Error saving bill: {e}")
             return False
     
+    def clear_bill_image(self, date, name):
+        """Remove the image from the bill last saved with a date and name.
+        
+        Used when the image copy fails after the bill was saved, so the row
+        neither points at a missing file nor picks up the receipt of a later
+        bill with the same date and name.
+        
+        Args:
+            date: The date of the bill as a datetime.
+            name: The name of the bill.
+            
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        try:
+            image_filename = os.path.basename(self.get_image_path(date, name))
+            schema = self.attach_year_database(date.year)
+            with self.conn:
+                self.conn.execute(CLEAR_BILL_IMAGE.format(schema=schema), (image_filename,))
+                self.conn.execute(CLEAR_BILL_IMAGE.format(schema="main"), (image_filename,))
+            self.invalidate_bill_cache(date.year)
+            self.invalidate_bill_cache(None)
+            return True
+        except Exception as e:
+            print(f"Error clearing bill image: {e}")
+            return False
+    
+    def get_image_path(self, date, name):
+        """Get the path a bill's image is stored under.
+        
+        Args:
+            date: The date of the bill as a datetime.
+            name: The name of the bill.
+            
+        Returns:
+            str: Path of the image inside bill_images.
+        """
+        return os.path.join("bill_images", f"{date.strftime('%m-%d-%Y')}_{name}.jpg")
+    
+    @staticmethod
+    def copy_image(image_path, dest_path):
+        """Copy a bill image into place, skipping the copy if it is already there.
+        
+        The image is always copied, never hard-linked, so later edits to the
+        user's original photo don't change the stored receipt. It is copied
+        under a temporary name and then renamed over dest_path, so readers
+        see either the previous file or the complete new one, and a failed
+        copy leaves the previous file in place.
+        
+        Args:
+            image_path: The path of the selected image.
+            dest_path: The path to copy it to.
+        """
+        folder = os.path.dirname(dest_path)
+        os.makedirs(folder, exist_ok=True)
+        if os.path.exists(dest_path) and os.path.samefile(image_path, dest_path):
+            return
+        temp_path = os.path.join(folder, f".{uuid.uuid4().hex}.tmp")
+        try:
+            # copyfile skips copying permission bits, which the app never uses
+            shutil.copyfile(image_path, temp_path)
+            # Replacing the name also unlinks a hard link left by older versions
+            # instead of writing through it to the user's original
+            os.replace(temp_path, dest_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    
     def create_tables_in_db(self, conn):
         """Create necessary tables in the provided database connection."""
-        query = """
-        CREATE TABLE IF NOT EXISTS bills (
-            id INTEGER PRIMARY KEY,
-            date TEXT,
-            name TEXT,
-            price TEXT,
-            image TEXT
-        )
-        """
-        conn.execute(query)
+        exists = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'bills'").fetchone()
+        conn.execute(CREATE_BILLS_TABLE)
+        if not exists:
+            # A new table already has the current schema, so no migration applies
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+        self.migrate_database(conn)
+        conn.execute(CREATE_DATE_INDEX)
+        conn.execute(CREATE_IMAGE_DATE_INDEX)
         conn.commit()
     
-    def get_bills(self, year=None, start_date=None, end_date=None):
+    def migrate_database(self, conn):
+        """Upgrade a database created by an older version of the application.
+        
+        The schema version is tracked with PRAGMA user_version so each
+        migration only runs once per database file.
+        
+        Args:
+            conn: The database connection to migrate.
+        """
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        
+        if version < 1:
+            # Dates used to be stored as MM/DD/YYYY, which doesn't sort chronologically
+            with conn:
+                conn.execute(
+                    "UPDATE bills SET date = substr(date, 7, 4) || '-' || substr(date, 1, 2) || '-' || substr(date, 4, 2) "
+                    "WHERE date LIKE '__/__/____'"
+                )
+                conn.execute("PRAGMA user_version = 1")
+        
+        if version < 2:
+            # Prices used to be stored as "$X.YZ" text; rebuild the table with a REAL column
+            with conn:
+                conn.execute("BEGIN")
+                conn.execute(
+                    "CREATE TABLE bills_new (id INTEGER PRIMARY KEY, date TEXT, name TEXT, price REAL, image TEXT)"
+                )
+                conn.execute(
+                    "INSERT INTO bills_new (id, date, name, price, image) "
+                    "SELECT id, date, name, CAST(replace(price, '$', '') AS REAL), image FROM bills"
+                )
+                conn.execute("DROP TABLE bills")
+                conn.execute("ALTER TABLE bills_new RENAME TO bills")
+                conn.execute("PRAGMA user_version = 2")
+        
+        if version < 3:
+            # REAL prices made sums drift and equality matches fragile; store whole cents
+            with conn:
+                conn.execute("BEGIN")
+                conn.execute(
+                    "CREATE TABLE bills_new (id INTEGER PRIMARY KEY, date TEXT, name TEXT, price_cents INTEGER, image TEXT)"
+                )
+                conn.execute(
+                    "INSERT INTO bills_new (id, date, name, price_cents, image) "
+                    "SELECT id, date, name, CAST(round(price * 100) AS INTEGER), image FROM bills"
+                )
+                conn.execute("DROP TABLE bills")
+                conn.execute("ALTER TABLE bills_new RENAME TO bills")
+                conn.execute("PRAGMA user_version = 3")
+        
+        if version < 4:
+            # Cash bills used to be found by matching "Cash" in the name on every total
+            with conn:
+                conn.execute("ALTER TABLE bills ADD COLUMN is_cash INTEGER NOT NULL DEFAULT 0")
+                conn.execute("UPDATE bills SET is_cash = instr(name, 'Cash') > 0")
+                conn.execute("PRAGMA user_version = 4")
+    
+    def get_bills(self, year=None, start_date=None, end_date=None, order=None):
         """Get bills from the database with optional filtering.
         
         Args:
             year: The year to get bills from. If None, uses the in-memory database.
-            start_date: Optional start date for filtering.
-            end_date: Optional end date for filtering.
+            start_date: Optional start datetime for filtering.
+            end_date: Optional end datetime for filtering.
+            order: Optional sort order by date, "asc" or "desc".
             
         Returns:
             list: List of bill tuples (date, name, price).
@@ -143,27 +409,34 @@ class DatabaseManager:
         conn = self.get_db_connection(year)
         
         if start_date and end_date:
-            query = "SELECT date, name, price FROM bills WHERE date BETWEEN ? AND ?"
-            cursor = conn.execute(query, (start_date, end_date))
+            if start_date > end_date:
+                return []  # An inverted range can't match anything, so skip the query
+            params = (start_date.strftime(ISO_DATE_FORMAT), end_date.strftime(ISO_DATE_FORMAT))
         else:
-            query = "SELECT date, name, price FROM bills"
-            cursor = conn.execute(query)
+            params = ()
         
-        bills = cursor.fetchall()
+        # Repeated queries (same range, tab switches) are answered from the cache
+        key = (self.get_cache_year(year), params, order)
+        bills = self.bill_cache.get(key)
+        if bills is None:
+            # Fetch everything in one call instead of stepping the cursor row by row
+            bills = conn.execute(SELECT_BILLS_QUERIES[bool(params), order], params).fetchall()
+            self.bill_cache[key] = bills
+            if len(self.bill_cache) > BILL_CACHE_SIZE:
+                self.bill_cache.popitem(last=False)
+        else:
+            self.bill_cache.move_to_end(key)
         
-        # Close the connection if it's not the in-memory database
-        if year is not None and year != "Present Database":
-            conn.close()
-            
-        return bills
+        # Callers get their own list, so changing it can't alter the cache
+        return list(bills)
     
     def get_bill_images(self, year=None, start_date=None, end_date=None):
         """Get bill images from the database with optional date filtering.
         
         Args:
             year: The year to get bills from. If None, uses the in-memory database.
-            start_date: Optional start date for filtering.
-            end_date: Optional end date for filtering.
+            start_date: Optional start datetime for filtering.
+            end_date: Optional end datetime for filtering.
             
         Returns:
             list: List of tuples containing (date, image_filename).
@@ -171,19 +444,16 @@ class DatabaseManager:
         conn = self.get_db_connection(year)
         
         if start_date and end_date:
-            query = "SELECT date, image FROM bills WHERE image IS NOT NULL AND date BETWEEN ? AND ?"
-            cursor = conn.execute(query, (start_date, end_date))
+            if start_date > end_date:
+                return []  # An inverted range can't match anything, so skip the query
+            cursor = conn.execute(
+                SELECT_BILL_IMAGES_BETWEEN,
+                (start_date.strftime(ISO_DATE_FORMAT), end_date.strftime(ISO_DATE_FORMAT))
+            )
         else:
-            query = "SELECT date, image FROM bills WHERE image IS NOT NULL"
-            cursor = conn.execute(query)
+            cursor = conn.execute(SELECT_BILL_IMAGES)
             
-        results = cursor.fetchall()
-        
-        # Close the connection if it's not the in-memory database
-        if year is not None and year != "Present Database":
-            conn.close()
-            
-        return results
+        return cursor.fetchall()
     
     def delete_bill(self, year, date, name, price):
         """Delete a bill from the database.
@@ -192,34 +462,83 @@ class DatabaseManager:
             year: The year of the database to delete from.
             date: The date of the bill.
             name: The name of the bill.
-            price: The price of the bill.
+            price: The price of the bill as displayed ($X.YZ).
+            
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        return self.delete_bills(year, [(date, name, price)])
+    
+    def delete_bills(self, year, bills):
+        """Delete several bills with a single executemany in one transaction.
+        
+        Args:
+            year: The year of the database to delete from.
+            bills: Iterable of (date, name, price) tuples as displayed.
             
         Returns:
             bool: True if successful, False otherwise.
         """
         try:
-            conn = sqlite3.connect(f"bills_{year}.db")
-            conn.execute("DELETE FROM bills WHERE date = ? AND name = ? AND price = ?", (date, name, price))
-            conn.commit()
-            conn.close()
+            conn = self.get_db_connection(year)
+            with conn:
+                conn.executemany(
+                    DELETE_BILL,
+                    [(DateHelper.to_iso(date), name, self.to_cents(price)) for date, name, price in bills]
+                )
+            self.invalidate_bill_cache(year)
             return True
         except Exception as e:
             print(f"Error deleting bill: {e}")
             return False
     
+    @staticmethod
+    def to_cents(price):
+        """Convert a displayed price to the whole cents it is stored as.
+        
+        Args:
+            price: The price as displayed ($X.YZ).
+            
+        Returns:
+            int: The price in cents.
+        """
+        return round(float(price.replace("$", "")) * 100)
+    
     def get_existing_databases(self):
         """Get a list of existing year-specific databases.
         
+        The folder is only rescanned when its modification time changes,
+        which happens whenever a file is created or removed in it.
+        
         Returns:
             list: List of years for which databases exist.
         """
-        years = []
-        for file in os.listdir('.'):
-            if file.startswith('bills_') and file.endswith('.db'):
-                year = file[6:10]
-                if year.isdigit():
-                    years.append(year)
-        return years
+        mtime = os.stat('.').st_mtime_ns
+        if self.database_listing is None or self.database_listing[0] != mtime:
+            with os.scandir('.') as entries:
+                years = [
+                    entry.name[6:10] for entry in entries if DATABASE_FILE_PATTERN.fullmatch(entry.name)
+                ]
+            self.database_listing = (mtime, years)
+        return list(self.database_listing[1])
+    
+    def get_existing_images(self):
+        """Get the filenames of all stored bill images with a single directory scan.
+        
+        Like get_existing_databases, the folder is only rescanned when its
+        modification time changes.
+        
+        Returns:
+            frozenset: Filenames present in the bill_images folder.
+        """
+        try:
+            mtime = os.stat("bill_images").st_mtime_ns
+        except FileNotFoundError:
+            return frozenset()
+        if self.image_listing is None or self.image_listing[0] != mtime:
+            with os.scandir("bill_images") as entries:
+                self.image_listing = (mtime, frozenset(entry.name for entry in entries))
+        return self.image_listing[1]
     
     def get_monthly_totals(self, year):
         """Calculate monthly totals for a specific year.
@@ -232,35 +551,22 @@ class DatabaseManager:
         """
         conn = self.get_db_connection(year)
         
-        query = "SELECT date, price, name FROM bills"
-        cursor = conn.execute(query)
-        
-        # Initialize monthly totals
-        monthly_totals = {month: {"cash": 0, "not_cash": 0, "total": 0} for month in range(1, 13)}
-        yearly_totals = {"cash": 0, "not_cash": 0, "total": 0}
-        
-        for row in cursor:
-            date = row[0]
-            price = float(row[1].replace("$", ""))
-            name = row[2]
+        monthly_totals = {month: {"cash": 0.0, "not_cash": 0.0, "total": 0.0} for month in range(1, 13)}
+        yearly_totals = {"cash": 0.0, "not_cash": 0.0, "total": 0.0}
+        for month, cash, not_cash in conn.execute(SELECT_MONTHLY_TOTALS):
+            if month in monthly_totals:
+                monthly_totals[month] = {"cash": cash, "not_cash": not_cash, "total": cash + not_cash}
+            yearly_totals["cash"] += cash
+            yearly_totals["not_cash"] += not_cash
+            yearly_totals["total"] += cash + not_cash
             
-            # Extract the month from the date
-            month = datetime.strptime(date, DATE_FORMAT).month
-            
-            # Determine if it's a cash transaction
-            if "Cash" in name:
-                monthly_totals[month]["cash"] += price
-                yearly_totals["cash"] += price
-            else:
-                monthly_totals[month]["not_cash"] += price
-                yearly_totals["not_cash"] += price
-                
-            # Update monthly and yearly totals
-            monthly_totals[month]["total"] += price
-            yearly_totals["total"] += price
-            
-        # Close the connection if it's not the in-memory database
-        if year is not None and year != "Present Database":
+        return monthly_totals, yearly_totals
+    
+    def close(self):
+        """Close all open year-specific database connections."""
+        for year in self.attached_years:
+            self.conn.execute(f"DETACH DATABASE yearly_{year}")
+        self.attached_years.clear()
+        for conn in self.year_connections.values():
             conn.close()
-            
-        return monthly_totals, yearly_totals
\ No newline at end of file
+        self.year_connections.clear()
@@ -1,3 +1,5 @@
+import os
+
 from PyQt5.QtWidgets import (
     QVBoxLayout, QPushButton, QLineEdit, QLabel, QHBoxLayout, QDialog, QCheckBox
 )
@@ -111,10 +113,14 @@ class MindeeAPIConfigDialog(QDialog):
         
         # Set the API key
         if MindeeHelper.set_api_key(api_key):
-            # Save the API key to a file
+            # Save the API key to a file only the current user can read
             try:
-                with open('mindee_api_key.txt', 'w') as f:
-                    f.write(api_key)
+                fd = os.open('mindee_api_key.txt', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                try:
+                    os.write(fd, api_key.encode('utf-8'))
+                finally:
+                    os.close(fd)
+                os.chmod('mindee_api_key.txt', 0o600)  # A file saved before keeps its old mode otherwise
             except Exception as e:
                 print(f"Error saving Mindee API key: {e}")
             
@@ -121,6 +121,10 @@ class MindeeHelper:
         Returns:
             bool: True if successful, False otherwise.
         """
+        # Saving the same key again keeps the client that is already set up
+        if api_key == MindeeHelper.api_key and MindeeHelper.mindee_client is not None:
+            return True
+        
         try:
             # Import Mindee Python package
             global product
@@ -152,11 +156,13 @@ class MindeeHelper:
             bool: True if API key was loaded successfully, False otherwise.
         """
         try:
-            if os.path.exists('mindee_api_key.txt'):
-                with open('mindee_api_key.txt', 'r') as f:
-                    api_key = f.read().strip()
-                    if api_key:
-                        return MindeeHelper.set_api_key(api_key)
+            try:
+                with open('mindee_api_key.txt', 'rb') as f:
+                    api_key = f.read().decode('utf-8').strip()
+            except FileNotFoundError:
+                api_key = ""
+            if api_key:
+                return MindeeHelper.set_api_key(api_key)
             print("API key file not found or empty. Please configure your Mindee API key.")
             return False
         except Exception as e:
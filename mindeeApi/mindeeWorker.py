@@ -1,33 +1,47 @@
-from PyQt5.QtCore import QThread, pyqtSignal
+import os
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
 from datetime import datetime
 
 from mindeeApi.mindeeHelper import MindeeHelper
 
-# OCR Worker Thread
-class MindeeWorker(QThread):
-    """Worker thread for processing receipt images with Mindee API."""
+
+class MindeeWorkerSignals(QObject):
+    """Signals emitted by MindeeWorker (QRunnable cannot emit signals itself)."""
     
-    # Signals
     progress = pyqtSignal(int)
     finished = pyqtSignal(dict)
+
+
+# OCR Worker
+class MindeeWorker(QRunnable):
+    """Process a receipt image with Mindee API on a QThreadPool thread."""
     
-    def __init__(self, image_path):
+    def __init__(self, image_path, data=None):
         """Initialize the worker with the image path.
         
         Args:
             image_path: Path to the receipt image.
+            data: Optional contents of the image, already read, to upload
+                instead of reading image_path again.
         """
         super().__init__()
         self.image_path = image_path
+        self.data = data
+        self.signals = MindeeWorkerSignals()
     
     def run(self):
-        """Process the receipt image using Mindee API."""
+        """Process the receipt image using Mindee API.
+        
+        Errors are not raised; they are reported through signals.finished
+        as a result with an "error" key.
+        """
         try:
             if not MindeeHelper.is_available():
                 raise Exception("Mindee API key is not set")
             
             # Signal progress updates
-            self.progress.emit(10)
+            self.signals.progress.emit(10)
             
             # Initialize result dictionary
             result = {
@@ -40,15 +54,20 @@ class MindeeWorker(QThread):
             from mindee import product
             
             # Open the input file
-            self.progress.emit(30)
+            self.signals.progress.emit(30)
             
             # Create a receipt prediction using Mindee API
-            input_doc = MindeeHelper.mindee_client.source_from_path(self.image_path)
-            self.progress.emit(50)
+            if self.data is not None:
+                input_doc = MindeeHelper.mindee_client.source_from_bytes(
+                    self.data, os.path.basename(self.image_path)
+                )
+            else:
+                input_doc = MindeeHelper.mindee_client.source_from_path(self.image_path)
+            self.signals.progress.emit(50)
             
             # Parse receipt using the Receipt API - use the client to parse, not the input_doc
             api_response = MindeeHelper.mindee_client.parse(product.ReceiptV5, input_doc)
-            self.progress.emit(80)
+            self.signals.progress.emit(80)
             
             # Increment the API usage counter
             MindeeHelper.increment_usage()
@@ -74,12 +93,12 @@ class MindeeWorker(QThread):
             # Extract total amount
             if hasattr(prediction, 'total_amount') and prediction.total_amount:
                 result["amount"] = str(prediction.total_amount.value)
-            self.progress.emit(100)
+            self.signals.progress.emit(100)
             
             # Emit the result
-            self.finished.emit(result)
+            self.signals.finished.emit(result)
             
         except Exception as e:
             print(f"Error in Mindee processing: {e}")
             # Emit empty result on error
-            self.finished.emit({"vendor": "", "date": "", "amount": "", "error": str(e)})
+            self.signals.finished.emit({"vendor": "", "date": "", "amount": "", "error": str(e)})
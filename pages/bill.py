@@ -1,10 +1,10 @@
 from PyQt5.QtWidgets import (
-    QVBoxLayout, QGridLayout, QWidget, QPushButton, QHBoxLayout, QListWidget, QLabel, QMainWindow
+    QVBoxLayout, QGridLayout, QWidget, QPushButton, QHBoxLayout, QListView, QLabel, QMainWindow
 )
 
 from PyQt5.QtGui import QIcon
 
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QStringListModel, QTimer
 
 from util.uiHelper import UIHelper
 
@@ -74,14 +74,26 @@ class bill(QMainWindow):
         name_layout.addWidget(name_label)
         
         self.name_input = UIHelper.create_input_field("Enter bill name")
-        self.name_input.textChanged.connect(self.show_autocomplete_suggestions)
         name_layout.addWidget(self.name_input)
         
+        # Look up suggestions once typing pauses instead of on every keystroke
+        self.suggestion_timer = QTimer(self)
+        self.suggestion_timer.setSingleShot(True)
+        self.suggestion_timer.setInterval(150)
+        self.suggestion_timer.timeout.connect(self.show_autocomplete_suggestions)
+        self.suggestion_query = None  # Text of the last suggestion lookup
+        self.suggestion_results = []
+        self.name_input.textChanged.connect(lambda: self.suggestion_timer.start())
+        
         # Show suggestions only when typing
-        self.suggestions_list = QListWidget()
+        # A string list model is reset in one call instead of rebuilding list items
+        self.suggestions_model = QStringListModel(self)
+        self.suggestions_list = QListView()
+        self.suggestions_list.setModel(self.suggestions_model)
+        self.suggestions_list.setEditTriggers(QListView.NoEditTriggers)
         self.suggestions_list.setFixedHeight(0)  # Hidden initially
-        self.suggestions_list.setFrameShape(QListWidget.NoFrame)
-        self.suggestions_list.itemClicked.connect(self.select_suggestion)
+        self.suggestions_list.setFrameShape(QListView.NoFrame)
+        self.suggestions_list.clicked.connect(self.select_suggestion)
         name_layout.addWidget(self.suggestions_list)
         
         left_column.addWidget(name_group)
@@ -176,8 +188,7 @@ class bill(QMainWindow):
         preview_container.setLayout(preview_container_layout)
         
         self.image_preview = QLabel()
-        self.image_preview.setAlignment(Qt.AlignCenter)
-        self.image_preview.setScaledContents(True)
+        self.image_preview.setAlignment(Qt.AlignCenter)  # Pixmaps are pre-scaled to fit
         preview_container_layout.addWidget(self.image_preview)
         
         preview_layout.addWidget(preview_container)
@@ -252,8 +263,9 @@ class bill(QMainWindow):
         recent_layout.addWidget(recent_title)
         
         # Recent bills table
-        self.present_bill_table = UIHelper.create_table(3, ["Date", "Name", "Price"])
+        self.present_bill_table = UIHelper.create_table_view(["Date", "Name", "Price"])
         self.present_bill_table.setMaximumHeight(200)
+        self.present_bill_model = self.present_bill_table.model()
         recent_layout.addWidget(self.present_bill_table)
         
         main_layout.addWidget(recent_card)
\ No newline at end of file
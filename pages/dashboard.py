@@ -1,6 +1,6 @@
 from datetime import datetime
 from PyQt5.QtWidgets import (
-    QMainWindow, QVBoxLayout, QWidget, QPushButton, QLineEdit, QLabel, QHBoxLayout, QTableWidgetItem
+    QMainWindow, QVBoxLayout, QWidget, QPushButton, QLineEdit, QLabel, QHBoxLayout
 )
 
 from PyQt5.QtGui import QIcon
@@ -171,11 +171,11 @@ class DashboardPage(QMainWindow):
         current_year = datetime.now().year
         
         # Format dates for query
-        start_date = f"{current_month:02d}/01/{current_year}"
+        start_date = datetime(current_year, current_month, 1)
         last_day = 30 if current_month in [4, 6, 9, 11] else 31
         if current_month == 2:
             last_day = 29 if current_year % 4 == 0 else 28
-        end_date = f"{current_month:02d}/{last_day}/{current_year}"
+        end_date = datetime(current_year, current_month, last_day)
         
         # Get bills for current month
         selected_year = str(current_year)
@@ -209,7 +209,7 @@ class DashboardPage(QMainWindow):
         # Update total amount
         total_month_amount = self.dashboard_page.findChildren(QLabel, "stat-number")[1]
         if total_month_amount:
-            total_month_amount.setText(f"${total_amount:.2f}")
+            total_month_amount.setText(UIHelper.format_price(total_amount))
         
         # Update top category
         top_category = max(category_counts.items(), key=lambda x: x[1])[0] if category_counts else "--"
@@ -219,16 +219,9 @@ class DashboardPage(QMainWindow):
 
     def update_recent_bills_table(self):
         """Update the recent bills table on the dashboard."""
-        self.recent_bills_table.setRowCount(0)
-        
         # Get the most recent bills (limit to 5)
         bills = self.db_manager.get_bills()
         recent_bills = bills[-5:] if len(bills) > 5 else bills
         
         # Add the bills to the table in reverse order (newest first)
-        for bill in reversed(recent_bills):
-            row_count = self.recent_bills_table.rowCount()
-            self.recent_bills_table.insertRow(row_count)
-            self.recent_bills_table.setItem(row_count, 0, QTableWidgetItem(bill[0]))
-            self.recent_bills_table.setItem(row_count, 1, QTableWidgetItem(bill[1]))
-            self.recent_bills_table.setItem(row_count, 2, QTableWidgetItem(bill[2]))
\ No newline at end of file
+        UIHelper.populate_table(self.recent_bills_table, recent_bills[::-1])
\ No newline at end of file
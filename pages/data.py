@@ -24,5 +24,6 @@ class data(QMainWindow):
             # Section: Monthly Expenditure
             self.data_layout.addWidget(UIHelper.create_section_label("Monthly Expenditure"))
 
-            self.data_table = UIHelper.create_table(4, ["Month", "Cash", "Not Cash", "Total"])
+            self.data_table = UIHelper.create_table_view(["Month", "Cash", "Not Cash", "Total"])
+            self.data_model = self.data_table.model()
             self.data_layout.addWidget(self.data_table)
\ No newline at end of file
@@ -1,12 +1,10 @@
 import os
 from PyQt5.QtWidgets import (
-    QVBoxLayout, QWidget, QComboBox, QHBoxLayout, QScrollArea, QLabel, QMainWindow
+    QVBoxLayout, QWidget, QComboBox, QHBoxLayout, QListView, QAbstractItemView, QMainWindow
 )
 
-from PyQt5.QtGui import QPixmap
-from PyQt5.QtCore import Qt
-
 from util.dateHelper import DateHelper
+from util.photoListModel import PhotoItemDelegate, PhotoListModel
 from util.uiHelper import UIHelper
 
 class photos(QMainWindow):
@@ -49,42 +47,42 @@ class photos(QMainWindow):
             # Section: Photo Gallery
             self.photos_layout.addWidget(UIHelper.create_section_label("Photo Gallery"))
 
-            # Scrollable image view
-            self.scroll_area = QScrollArea()
-            self.scroll_content = QWidget()
-            self.scroll_layout = QVBoxLayout(self.scroll_content)
-            self.scroll_area.setWidget(self.scroll_content)
-            self.scroll_area.setWidgetResizable(True)
-            self.photos_layout.addWidget(self.scroll_area)
+            # Photo list; only the rows scrolled into view are decoded and drawn
+            self.photos_model = PhotoListModel(self)
+            self.photos_view = QListView()
+            self.photos_view.setModel(self.photos_model)
+            self.photos_view.setItemDelegate(PhotoItemDelegate(self.photos_view))
+            self.photos_view.setUniformItemSizes(True)
+            self.photos_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+            self.photos_view.setSelectionMode(QAbstractItemView.NoSelection)
+            self.photos_layout.addWidget(self.photos_view)
 
             # Load images 
             self.load_all_photos()
         
     def load_all_photos(self):
         """Load all photos from the database."""
-        if not hasattr(self, 'scroll_layout'):
-            return  # Exit early if layout not initialized
-            
-        self.clear_layout(self.scroll_layout)  # Clear previous images
+        if not hasattr(self, 'photos_model'):
+            return  # Exit early if the photo list is not initialized
         
         selected_year = self.photos_year_selector.currentText() if hasattr(self, 'photos_year_selector') else None
         
         # Get all bill images
         bill_images = self.db_manager.get_bill_images(selected_year)
-        
-        # Add images to the photos page
-        for date, image_filename in bill_images:
-            if image_filename:
-                image_path = os.path.join("bill_images", image_filename)
-                if os.path.exists(image_path):
-                    self.add_image_to_photos_page(date, image_path)
+        self.show_photos(bill_images)
     
-    def add_image_to_photos_page(self, date, image_path):
-        image_label = QLabel()
-        pixmap = QPixmap(image_path)
-        image_label.setPixmap(pixmap.scaled(400, 400, Qt.KeepAspectRatio))
-        self.scroll_layout.addWidget(QLabel(f"Date: {date}"))
-        self.scroll_layout.addWidget(image_label)
+    def show_photos(self, bill_images):
+        """Show the bill images that exist on disk in the photo list.
+
+        Args:
+            bill_images: List of (date, image_filename) tuples
+        """
+        existing_images = self.db_manager.get_existing_images()
+        self.photos_model.set_rows(
+            (date, os.path.join("bill_images", image_filename))
+            for date, image_filename in bill_images
+            if image_filename in existing_images
+        )
     
     def filter_photos_by_date(self):
         """Filter photos by date range."""
@@ -97,17 +95,9 @@ class photos(QMainWindow):
             # If invalid date range, show all photos
             self.load_all_photos()
             return
-            
-        self.clear_layout(self.scroll_layout)  # Clear existing images
         
         selected_year = self.photos_year_selector.currentText() if hasattr(self, 'photos_year_selector') else None
         
         # Get filtered bill images
         bill_images = self.db_manager.get_bill_images(selected_year, start_date, end_date)
-        
-        # Add images to the photos page
-        for date, image_filename in bill_images:
-            if image_filename:
-                image_path = os.path.join("bill_images", image_filename)
-                if os.path.exists(image_path):
-                    self.add_image_to_photos_page(date, image_path)
\ No newline at end of file
+        self.show_photos(bill_images)
@@ -0,0 +1,47 @@
+import os
+import shutil
+from datetime import datetime
+
+import pytest
+
+from database.databaseManager import DatabaseManager
+
+
+def get_images(conn):
+    return [row[0] for row in conn.execute("SELECT image FROM bills ORDER BY id")]
+
+
+def test_clear_bill_image_only_clears_the_newest_bill(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    db_manager = DatabaseManager()
+    date = datetime(2026, 5, 5)
+    db_manager.save_bill(date, "Store", 10.0, "first.jpg", copy_image=False)
+    db_manager.save_bill(date, "Store", 12.5, "second.jpg", copy_image=False)
+
+    assert db_manager.clear_bill_image(date, "Store")
+
+    # The earlier bill keeps the receipt stored under the shared filename
+    assert get_images(db_manager.conn) == ["05-05-2026_Store.jpg", None]
+    assert get_images(db_manager.get_db_connection(2026)) == ["05-05-2026_Store.jpg", None]
+    db_manager.close()
+
+
+def test_failed_copy_image_keeps_the_previous_file(tmp_path, monkeypatch):
+    old_photo, new_photo = tmp_path / "old.jpg", tmp_path / "new.jpg"
+    old_photo.write_bytes(b"old receipt")
+    new_photo.write_bytes(b"new receipt")
+    dest_path = tmp_path / "bill_images" / "05-05-2026_Store.jpg"
+    DatabaseManager.copy_image(str(old_photo), str(dest_path))
+
+    def copy_part_then_fail(source, target):
+        with open(target, "wb") as file:
+            file.write(b"new")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(shutil, "copyfile", copy_part_then_fail)
+    with pytest.raises(OSError):
+        DatabaseManager.copy_image(str(new_photo), str(dest_path))
+
+    # Readers never see the partial copy, and no temporary file is left behind
+    assert dest_path.read_bytes() == b"old receipt"
+    assert os.listdir(dest_path.parent) == [dest_path.name]
@@ -0,0 +1,114 @@
+import os
+import shutil
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtGui import QColor, QGuiApplication, QImage
+
+from database.databaseManager import DatabaseManager
+from util.workers import ImageLoader
+
+app = QGuiApplication.instance() or QGuiApplication([])
+
+MONTH_NS = 30 * 24 * 60 * 60 * 10**9
+
+
+def save_photo(path, color, mtime_ns, width=64, height=48):
+    """Write a solid-color image with the given modification time."""
+    image = QImage(width, height, QImage.Format_RGB32)
+    image.fill(QColor(color))
+    assert image.save(str(path))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def load_color(image_path):
+    """Run an ImageLoader on the current thread and return the loaded image's color."""
+    loaded = []
+    loader = ImageLoader(image_path)
+    loader.signals.loaded.connect(lambda path, image: loaded.append(image))
+    loader.run()
+    return loaded[0].pixelColor(0, 0).name()
+
+
+def is_blue(color_name):
+    """Check a #rrggbb color is blue, allowing for JPEG compression."""
+    color = QColor(color_name)
+    return color.red() < 16 and color.green() < 16 and color.blue() > 240
+
+
+def test_replaced_bill_image_with_older_photo_is_reloaded(tmp_path):
+    now = time.time_ns()
+    red, blue = tmp_path / "red.png", tmp_path / "blue.png"
+    save_photo(red, "red", now)
+    save_photo(blue, "blue", now - MONTH_NS)  # Taken before the first thumbnail is made
+    dest_path = str(tmp_path / "bill_images" / "05-05-2026_Store.png")
+
+    DatabaseManager.copy_image(str(red), dest_path)
+    assert load_color(dest_path) == "#ff0000"
+
+    DatabaseManager.copy_image(str(blue), dest_path)
+    assert not os.path.samefile(blue, dest_path)  # The receipt is a copy, not the user's photo
+    assert load_color(dest_path) == "#0000ff"
+
+
+def test_image_replaced_with_older_mtime_is_not_served_from_thumbnail(tmp_path):
+    now = time.time_ns()
+    red, blue = tmp_path / "red.png", tmp_path / "blue.png"
+    save_photo(red, "red", now)
+    save_photo(blue, "blue", now - MONTH_NS)
+    dest_path = str(tmp_path / "bill_images" / "05-05-2026_Store.png")
+
+    DatabaseManager.copy_image(str(red), dest_path)
+    assert load_color(dest_path) == "#ff0000"
+
+    # copy2 keeps the old mtime, so the image now looks older than its thumbnail
+    shutil.copy2(blue, dest_path)
+    assert load_color(dest_path) == "#0000ff"
+
+
+def test_overlapping_loader_never_reads_a_half_written_thumbnail(tmp_path, monkeypatch):
+    photo = tmp_path / "photo.jpg"
+    save_photo(photo, "blue", time.time_ns(), 400, 300)
+    dest_path = str(tmp_path / "bill_images" / "05-05-2026_Store.jpg")
+    DatabaseManager.copy_image(str(photo), dest_path)
+    assert is_blue(load_color(dest_path))  # Writes the thumbnail and its stamp
+
+    # A second loader that checked before the stamp existed rebuilds the thumbnail,
+    # while a third one, which finds the matching stamp, reads it mid-write
+    stamp_path = os.path.join(os.path.dirname(dest_path), ".thumbs", "05-05-2026_Store.jpg.stamp")
+    stamp = open(stamp_path).read()
+    os.remove(stamp_path)
+    real_save = QImage.save
+    overlapping = []
+    saving = []
+
+    def save_in_two_parts(image, path, *args):
+        if saving:
+            return real_save(image, path, *args)  # Only the first save is interleaved
+        saving.append(path)
+        scratch_path = str(tmp_path / "scratch.jpg")
+        real_save(image, scratch_path)
+        data = open(scratch_path, "rb").read()
+        with open(stamp_path, "w") as file:
+            file.write(stamp)
+        with open(path, "wb") as file:
+            file.write(data[:len(data) // 2])
+            file.flush()
+            loaded = []
+            loader = ImageLoader(dest_path)
+            loader.signals.loaded.connect(lambda path, image: loaded.append(image))
+            loader.run()
+            overlapping.append(loaded[0])
+            file.write(data[len(data) // 2:])
+        return True
+
+    monkeypatch.setattr(QImage, "save", save_in_two_parts)
+    assert is_blue(load_color(dest_path))
+
+    # A truncated JPEG still decodes, with its lower part left grey
+    image = overlapping[0]
+    assert is_blue(image.pixelColor(image.width() - 1, image.height() - 1).name())
+    assert sorted(os.listdir(os.path.dirname(stamp_path))) == [
+        "05-05-2026_Store.jpg", "05-05-2026_Store.jpg.stamp"
+    ]
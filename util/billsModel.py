@@ -0,0 +1,98 @@
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+# Rows handed to the view at a time; more are added as the user scrolls
+FETCH_BATCH_SIZE = 500
+
+
+class BillsModel(QAbstractTableModel):
+    """Table model that keeps bill rows as plain tuples for a QTableView."""
+
+    def __init__(self, headers, parent=None):
+        """Initialize the model with its column headers.
+
+        Args:
+            headers: List of original (untranslated) column headers
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        self.headers = list(headers)
+        self._header_labels = list(headers)
+        self._rows = []
+        self._loaded = 0  # Rows the view has been told about so far
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._header_labels[section]
+        return super().headerData(section, orientation, role)
+
+    def setHorizontalHeaderLabels(self, labels):
+        """Set the displayed header labels (e.g. after a language change).
+
+        Args:
+            labels: List of header labels, one per column
+        """
+        self._header_labels = list(labels)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._header_labels) - 1)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(FETCH_BATCH_SIZE, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def set_rows(self, rows):
+        """Replace all rows with a single model reset.
+
+        Only the first FETCH_BATCH_SIZE rows are shown at first; the view
+        pulls in the rest through fetchMore as it is scrolled.
+
+        Args:
+            rows: Iterable of row tuples
+        """
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._loaded = min(FETCH_BATCH_SIZE, len(self._rows))
+        self.endResetModel()
+
+    def rows(self):
+        """Get all rows held by the model, including ones not fetched by the view yet.
+
+        Returns:
+            list: List of row tuples.
+        """
+        return self._rows
+
+    def row(self, row):
+        """Get a single row tuple by index."""
+        return self._rows[row]
+
+    def remove_row(self, row):
+        """Remove a single row from the model."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._loaded -= 1
+        self.endRemoveRows()
@@ -1,31 +1,69 @@
+import re
 from datetime import datetime
+from functools import lru_cache
 
 DATE_FORMAT = "%m/%d/%Y"
-DATE_FORMATS = ["%m/%d/%y", "%m/%d/%Y"]
+
+# M/D/YY or M/D/YYYY, the same forms strptime accepted with %m/%d/%y and %m/%d/%Y
+MDY_PATTERN = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4}|\d{2})")
+
+
+def _fast_parse_mdy(date_text):
+    """Parse an M/D/YY or M/D/YYYY date with a compiled regex instead of strptime.
+    
+    Args:
+        date_text: The date text to parse.
+        
+    Returns:
+        datetime: The parsed date, or None if the text is not in either form.
+    """
+    match = MDY_PATTERN.fullmatch(date_text)
+    if not match:
+        return None
+    month, day, year = match.groups()
+    full_year = int(year)
+    if len(year) == 2:
+        # Same pivot as strptime's %y: 69-99 -> 1900s, 00-68 -> 2000s
+        full_year += 1900 if full_year >= 69 else 2000
+    try:
+        return datetime(full_year, int(month), int(day))
+    except ValueError:
+        return None
+
 
 class DateHelper:
     
     """Helper class for handling date operations."""
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def parse_date(date_text):
-        """Parse a date from text using multiple formats.
+        """Parse an M/D/YY or M/D/YYYY date from text.
+        
+        Results are cached by text; datetimes are immutable, so they can be shared.
         
         Args:
             date_text: The date text to parse.
             
         Returns:
-            str: The formatted date in MM/dd/YYYY format, or None if parsing fails.
+            datetime: The parsed date, or None if parsing fails.
         """
         if not date_text:
             return None
+        
+        return _fast_parse_mdy(date_text)
+    
+    @staticmethod
+    def to_iso(date_text):
+        """Convert an MM/dd/YYYY date to the ISO YYYY-MM-DD form used for storage.
+        
+        Args:
+            date_text: The date text in MM/dd/YYYY format.
             
-        for date_format in DATE_FORMATS:
-            try:
-                return datetime.strptime(date_text, date_format).strftime(DATE_FORMAT)
-            except ValueError:
-                continue
-        return None
+        Returns:
+            str: The date in YYYY-MM-DD format.
+        """
+        return f"{date_text[6:10]}-{date_text[0:2]}-{date_text[3:5]}"
     
     @staticmethod
     def parse_date_range(start_date_text, end_date_text):
@@ -36,7 +74,7 @@ class DateHelper:
             end_date_text: The end date text.
             
         Returns:
-            tuple: (start_date, end_date) in MM/dd/YYYY format, or (None, None) if parsing fails.
+            tuple: (start_date, end_date) as datetimes, or (None, None) if parsing fails.
         """
         start_date = DateHelper.parse_date(start_date_text)
         end_date = DateHelper.parse_date(end_date_text)
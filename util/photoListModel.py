@@ -0,0 +1,114 @@
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QSize, Qt, QThreadPool
+from PyQt5.QtGui import QPixmap, QPixmapCache
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
+
+from util.uiHelper import UIHelper
+from util.workers import ImageLoader
+
+# Photos are scaled down to fit a square of this many pixels
+PHOTO_SIZE = 400
+
+
+class PhotoListModel(QAbstractListModel):
+    """List model of bill photos that only decodes the images a view asks for."""
+
+    def __init__(self, parent=None):
+        """Initialize an empty model.
+
+        Args:
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        self._rows = []
+        self._cache_keys = {}  # Image path -> QPixmapCache key, built on first use
+        self._loading = set()
+        self._failed = set()  # Images that could not be decoded; not requested again
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        date, image_path = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return f"Date: {date}"
+        if role == Qt.DecorationRole:
+            pixmap = QPixmapCache.find(self.cache_key(image_path))
+            if pixmap is None and image_path not in self._failed:
+                self.request_photo(image_path)
+            return pixmap
+        return None
+
+    def set_rows(self, rows):
+        """Replace all photos with a single model reset.
+
+        Args:
+            rows: Iterable of (date, image_path) tuples
+        """
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._cache_keys = {}  # Pick up images replaced since the last refresh
+        self._failed = set()
+        self.endResetModel()
+
+    def cache_key(self, image_path):
+        """Get the QPixmapCache key of an image's thumbnail.
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            str: The cache key
+        """
+        key = self._cache_keys.get(image_path)
+        if key is None:
+            key = UIHelper.pixmap_cache_key(image_path, PHOTO_SIZE)
+            self._cache_keys[image_path] = key
+        return key
+
+    def request_photo(self, image_path):
+        """Decode an image on the thread pool unless it is already loading.
+
+        Args:
+            image_path: Path to the image file
+        """
+        if image_path in self._loading:
+            return
+        self._loading.add(image_path)
+        loader = ImageLoader(image_path, QSize(PHOTO_SIZE, PHOTO_SIZE))
+        loader.signals.loaded.connect(self.on_photo_loaded)
+        QThreadPool.globalInstance().start(loader)
+
+    def on_photo_loaded(self, image_path, image):
+        """Cache a decoded image and let the views repaint it.
+
+        Args:
+            image_path: Path to the image file
+            image: Decoded, downscaled QImage
+        """
+        self._loading.discard(image_path)
+        if image.isNull():
+            self._failed.add(image_path)
+            return
+        QPixmapCache.insert(self.cache_key(image_path), QPixmap.fromImage(image))
+        if self._rows:
+            # Views only repaint the rows they show, so one signal for every row is cheap
+            self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1), [Qt.DecorationRole])
+
+
+class PhotoItemDelegate(QStyledItemDelegate):
+    """Draws a photo row as its date with the picture underneath."""
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        option.decorationPosition = QStyleOptionViewItem.Bottom
+        option.decorationAlignment = Qt.AlignLeft | Qt.AlignTop
+        option.displayAlignment = Qt.AlignLeft | Qt.AlignTop
+
+    def sizeHint(self, option, index):
+        # Rows are as tall as a full-size photo whether it is loaded or not, so
+        # the view can use uniform item sizes and the scroll range stays put
+        return QSize(PHOTO_SIZE, PHOTO_SIZE + option.fontMetrics.height() + 20)
@@ -314,8 +314,8 @@ class StyleSheet:
                 width: 0px;
             }
             
-            /* List widget */
-            QListWidget {
+            /* List views (also matches QListWidget) */
+            QListView {
                 border: 1px solid #cbd5e1;
                 border-radius: 4px;
                 background-color: white;
@@ -324,17 +324,17 @@ class StyleSheet:
                 outline: none;
             }
             
-            QListWidget::item {
+            QListView::item {
                 padding: 5px;
                 border-bottom: 1px solid #f1f5f9;
             }
             
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #bfdbfe;
                 color: #1e293b;
             }
             
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #f1f5f9;
             }
             
@@ -132,6 +132,8 @@ class TranslationManager:
         "Please enter date, name, and price.": {"es": "Por favor ingrese fecha, nombre y precio."},
         "Invalid date format. Please use MM/dd/yyyy.": {"es": "Formato de fecha inválido. Use MM/dd/yyyy."},
         "Failed to save bill. Please try again.": {"es": "Error al guardar factura. Intente nuevamente."},
+        "Bill saved, but its image could not be copied.": {"es": "Factura guardada, pero no se pudo copiar su imagen."},
+        "Failed to read the selected image.": {"es": "No se pudo leer la imagen seleccionada."},
         "Selection Error": {"es": "Error de Selección"},
         "No row selected.": {"es": "Ninguna fila seleccionada."},
         "Failed to delete bill. Please try again.": {"es": "Error al eliminar factura. Intente nuevamente."},
@@ -160,6 +162,7 @@ class TranslationManager:
     def __init__(self):
         """Initialize the translation manager with English as default."""
         self.current_language = "en"
+        self.table = None  # English text -> current language text; None for English
         
     def set_language(self, language_code):
         """Set the current language.
@@ -169,6 +172,12 @@ class TranslationManager:
         """
         if language_code in ["en", "es"]:
             self.current_language = language_code
+            # Flatten the lookups for this language once, so translate is a single get
+            self.table = None if language_code == "en" else {
+                text: translations[language_code]
+                for text, translations in self.TRANSLATIONS.items()
+                if language_code in translations
+            }
             return True
         return False
         
@@ -181,9 +190,6 @@ class TranslationManager:
         Returns:
             str: Translated text if available, otherwise the original text
         """
-        if self.current_language == "en":
+        if self.table is None:
             return text
-            
-        if text in self.TRANSLATIONS and self.current_language in self.TRANSLATIONS[text]:
-            return self.TRANSLATIONS[text][self.current_language]
-        return text
+        return self.table.get(text, text)
@@ -1,45 +1,112 @@
+# Shortest text that is also matched in the middle of names
+MIN_SUBSTRING_LENGTH = 3
+
+
 class TrieNode:
+    # The suffix index creates many nodes; slots keep each one small
+    __slots__ = ("children", "is_end_of_word", "word", "suffix_of")
+
     def __init__(self):
         self.children = {}
         self.is_end_of_word = False
         self.word = None  # Store the original word
+        self.suffix_of = None  # Original words that end with this node's path (suffix index)
 
 class Trie:
     def __init__(self):
         self.root = TrieNode()
-        self.words = []  # Store all words for substring search
+        self.suffix_root = TrieNode()  # Every suffix of every word, for substring search
+        self.last_lookups = {}  # Root -> (text, node) of the previous lookup from that root
 
     def insert(self, word):
-        node = self.root
-        for char in word.lower():
+        self.last_lookups.clear()  # A remembered miss may match after this insert
+        lowered = word.lower()
+        node = self._insert_path(self.root, lowered)
+        node.is_end_of_word = True
+        node.word = word  # Store the original word
+        # Index every suffix so a substring search is a prefix search from suffix_root
+        for i in range(len(lowered)):
+            node = self._insert_path(self.suffix_root, lowered[i:])
+            if node.suffix_of is None:
+                node.suffix_of = []
+            node.suffix_of.append(word)
+
+    def _insert_path(self, node, text):
+        for char in text:
             if char not in node.children:
                 node.children[char] = TrieNode()
             node = node.children[char]
-        node.is_end_of_word = True
-        node.word = word  # Store the original word
-        self.words.append(word)  # Add word to the list
+        return node
 
-    def search(self, prefix):
-        node = self.root
-        for char in prefix.lower():
+    def _find_node(self, node, text):
+        for char in text:
             if char not in node.children:
-                return []
+                return None
             node = node.children[char]
-        return self._find_words_from_node(node)
+        return node
 
-    def _find_words_from_node(self, node):
+    def _find_node_from(self, root, text):
+        # Typing usually extends the previous text, so continue from the node it
+        # reached and only walk the new characters
+        last = self.last_lookups.get(root)
+        if last is not None and text.startswith(last[0]):
+            node = last[1]
+            if node is not None:
+                node = self._find_node(node, text[len(last[0]):])
+        else:
+            node = self._find_node(root, text)
+        self.last_lookups[root] = (text, node)
+        return node
+
+    def contains(self, word):
+        node = self._find_node(self.root, word.lower())
+        return node is not None and node.is_end_of_word
+
+    def search(self, prefix, limit=None):
+        node = self._find_node_from(self.root, prefix.lower())
+        if node is None:
+            return []
         words = []
+        self._find_words_from_node(node, words, limit)
+        return words
+
+    def search_substring(self, text, limit=None):
+        node = self._find_node_from(self.suffix_root, text.lower())
+        if node is None:
+            return []
+        words = {}  # Ordered set; a word can be reached through several suffixes
+        self._find_suffix_words_from_node(node, words, limit)
+        return list(words)
+
+    def _find_words_from_node(self, node, words, limit=None):
+        # Stop walking the subtree as soon as enough words were found
+        if limit is not None and len(words) >= limit:
+            return
         if node.is_end_of_word:
             words.append(node.word)
         for char, child_node in node.children.items():
-            words.extend(self._find_words_from_node(child_node))
-        return words
+            self._find_words_from_node(child_node, words, limit)
+            if limit is not None and len(words) >= limit:
+                return
+
+    def _find_suffix_words_from_node(self, node, words, limit=None):
+        for word in node.suffix_of or ():
+            if limit is not None and len(words) >= limit:
+                return
+            words.setdefault(word)
+        for char, child_node in node.children.items():
+            self._find_suffix_words_from_node(child_node, words, limit)
+            if limit is not None and len(words) >= limit:
+                return
 
     def get_suggestions(self, prefix, limit=7):
+        prefix = prefix.lower()
         # Find words that start with the prefix
-        words = self.search(prefix)
-        # Find words that contain the prefix as a substring
-        similar_words = [word for word in self.words if prefix.lower() in word.lower()]
-        # Combine and deduplicate the results
-        all_suggestions = list(dict.fromkeys(words + similar_words))
-        return all_suggestions[:limit]
\ No newline at end of file
+        suggestions = dict.fromkeys(self.search(prefix, limit))
+        # Fill up with words that contain the prefix as a substring; these include
+        # the prefix matches again, so ask for enough to cover them. One or two
+        # letters match almost every word, so short prefixes only use prefix matches
+        if len(suggestions) < limit and len(prefix) >= MIN_SUBSTRING_LENGTH:
+            for word in self.search_substring(prefix, limit + len(suggestions)):
+                suggestions.setdefault(word)
+        return list(suggestions)[:limit]
@@ -1,8 +1,13 @@
+import os
+
+from util.billsModel import BillsModel
 from util.translationManager import TranslationManager
 
 from PyQt5.QtWidgets import (
-    QWidget, QPushButton, QTableWidget, QLineEdit, QLabel
+    QWidget, QPushButton, QTableWidget, QTableWidgetItem, QTableView, QLineEdit, QLabel
 )
+from PyQt5.QtGui import QImageReader, QPixmap, QPixmapCache
+from PyQt5.QtCore import QBuffer, QIODevice, Qt
 
 
 class UIHelper:
@@ -107,6 +112,115 @@ class UIHelper:
         table.setAlternatingRowColors(True)
         return table
     
+    @staticmethod
+    def populate_table(table, rows):
+        """Fill a QTableWidget with rows, sizing it once up front.
+        
+        Items already in the table are updated in place, so reloading only
+        allocates items for rows the table did not have before.
+        
+        Args:
+            table: The QTableWidget to fill
+            rows: List of row tuples; each value goes in the matching column
+        """
+        # A sorting table would move rows around while they are being filled
+        sorting_enabled = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(len(rows))
+            # Bind the per-cell calls once instead of looking them up for every cell
+            get_item, set_item, new_item = table.item, table.setItem, QTableWidgetItem
+            for row, values in enumerate(rows):
+                for column, value in enumerate(values):
+                    # Reuse the item left from a previous fill where there is one
+                    item = get_item(row, column)
+                    if item is None:
+                        set_item(row, column, new_item(value))
+                    else:
+                        item.setText(value)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting_enabled)
+    
+    # Bound str.format, so the format spec is parsed once rather than per call
+    format_price = staticmethod("${:.2f}".format)
+    
+    @staticmethod
+    def load_scaled_pixmap(image_path, size, data=None):
+        """Load an image scaled to fit a square box, reusing QPixmapCache.
+        
+        The decoder scales while reading, so a large photo is never
+        decoded at full size.
+        
+        Args:
+            image_path: Path to the image file
+            size: Width and height of the box in pixels
+            data: Optional contents of the file, already read, to decode
+                instead of reading image_path again
+            
+        Returns:
+            QPixmap: The scaled image
+        """
+        key = UIHelper.pixmap_cache_key(image_path, size)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            if data is None:
+                reader = QImageReader(image_path)
+            else:
+                buffer = QBuffer()
+                buffer.setData(data)
+                buffer.open(QIODevice.ReadOnly)
+                reader = QImageReader(buffer)
+            original_size = reader.size()
+            if original_size.isValid():
+                reader.setScaledSize(original_size.scaled(size, size, Qt.KeepAspectRatio))
+            pixmap = QPixmap.fromImageReader(reader)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+    
+    @staticmethod
+    def pixmap_cache_key(image_path, size):
+        """Build the QPixmapCache key for an image scaled to a given size.
+        
+        The key includes the file's modification time, so an image that is
+        replaced on disk is decoded again instead of served from the cache.
+        
+        Args:
+            image_path: Path to the image file
+            size: Size the cached pixmap is scaled to
+            
+        Returns:
+            str: The cache key
+        """
+        try:
+            mtime = os.stat(image_path).st_mtime_ns
+        except OSError:
+            mtime = 0
+        return f"{image_path}@{mtime}@{size}"
+    
+    @staticmethod
+    def create_table_view(headers):
+        """Create a styled table view backed by a BillsModel.
+        
+        Args:
+            headers: List of column headers
+            
+        Returns:
+            QTableView: The created table view; its model is a BillsModel
+        """
+        table = QTableView()
+        model = BillsModel(headers, table)
+        model.setHorizontalHeaderLabels([UIHelper.translate(header) for header in headers])
+        table.setModel(model)
+        table.setProperty("original_headers", headers)  # Store original headers for translation updates
+        table.horizontalHeader().setStretchLastSection(True)
+        table.setAlternatingRowColors(True)
+        table.setSelectionBehavior(QTableView.SelectRows)
+        return table
+    
     @staticmethod
     def add_section_spacing(layout):
         """Add consistent spacing between sections.
@@ -0,0 +1,166 @@
+import json
+import os
+import uuid
+
+from PyQt5.QtCore import QObject, QRunnable, QSize, QThread, Qt, pyqtSignal
+from PyQt5.QtGui import QImage, QImageReader
+
+from database.databaseManager import DatabaseManager
+from util.trie import Trie
+
+# Downscaled copies are kept next to the originals, e.g. bill_images/.thumbs/<name>
+THUMBNAIL_FOLDER = ".thumbs"
+
+# Each thumbnail has a <name>.stamp file recording the image it was made from
+THUMBNAIL_STAMP_SUFFIX = ".stamp"
+
+
+class ImageLoaderSignals(QObject):
+    """Signals emitted by ImageLoader (QRunnable cannot emit signals itself)."""
+
+    loaded = pyqtSignal(str, QImage)
+
+
+class ImageLoader(QRunnable):
+    """Decode and downscale an image file on a QThreadPool thread."""
+
+    def __init__(self, image_path, size=QSize(400, 400)):
+        """Initialize the loader.
+
+        Args:
+            image_path: Path to the image file
+            size: Box the image is scaled down to fit, keeping aspect ratio
+        """
+        super().__init__()
+        self.image_path = image_path
+        self.size = size
+        self.signals = ImageLoaderSignals()
+
+    def run(self):
+        """Read the image (or its cached thumbnail) and emit it through signals.loaded."""
+        folder, filename = os.path.split(self.image_path)
+        thumbnail_path = os.path.join(folder, THUMBNAIL_FOLDER, filename)
+        stamp_path = thumbnail_path + THUMBNAIL_STAMP_SUFFIX
+        
+        # The thumbnail is only reused for the exact file it was made from. Comparing
+        # mtimes alone misses an image replaced by one with an older mtime
+        try:
+            stat = os.stat(self.image_path)
+            stamp = f"{stat.st_ino} {stat.st_size} {stat.st_mtime_ns}"
+        except OSError:
+            stamp = None
+        if stamp is not None:
+            try:
+                with open(stamp_path, 'r') as file:
+                    is_fresh = file.read() == stamp
+            except OSError:
+                is_fresh = False  # No thumbnail yet
+            if is_fresh:
+                image = QImageReader(thumbnail_path).read()
+                if not image.isNull():
+                    self.signals.loaded.emit(self.image_path, image)
+                    return
+        
+        reader = QImageReader(self.image_path)
+        original_size = reader.size()
+        if original_size.isValid() and (
+            original_size.width() > self.size.width() or original_size.height() > self.size.height()
+        ):
+            # Let the decoder scale while reading instead of decoding full size
+            reader.setScaledSize(original_size.scaled(self.size, Qt.KeepAspectRatio))
+        image = reader.read()
+        
+        if not image.isNull() and stamp is not None:
+            self.save_thumbnail(image, thumbnail_path, stamp_path, stamp)
+        self.signals.loaded.emit(self.image_path, image)
+    
+    def save_thumbnail(self, image, thumbnail_path, stamp_path, stamp):
+        """Store a thumbnail and its stamp without exposing half-written files.
+        
+        Both are written under temporary names and renamed into place, thumbnail
+        first. A loader running at the same time reads either the previous
+        files or the complete new ones.
+        
+        Args:
+            image: The decoded, downscaled QImage
+            thumbnail_path: Path the thumbnail is stored under
+            stamp_path: Path of the thumbnail's stamp file
+            stamp: Identity of the image the thumbnail was made from
+        """
+        folder = os.path.dirname(thumbnail_path)
+        temp_name = os.path.join(folder, f".{uuid.uuid4().hex}")
+        # Keep the extension so the thumbnail is saved in the image's format
+        temp_thumbnail_path = temp_name + os.path.splitext(thumbnail_path)[1]
+        temp_stamp_path = temp_name + THUMBNAIL_STAMP_SUFFIX
+        try:
+            os.makedirs(folder, exist_ok=True)
+            if image.save(temp_thumbnail_path):
+                os.replace(temp_thumbnail_path, thumbnail_path)
+                with open(temp_stamp_path, 'w') as file:
+                    file.write(stamp)
+                os.replace(temp_stamp_path, stamp_path)
+        except OSError as e:
+            print(f"Error saving thumbnail: {e}")
+        finally:
+            for path in (temp_thumbnail_path, temp_stamp_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+class ImageCopierSignals(QObject):
+    """Signals emitted by ImageCopier."""
+    
+    failed = pyqtSignal(str)
+
+
+class ImageCopier(QRunnable):
+    """Copy a bill image into bill_images on a QThreadPool thread."""
+    
+    def __init__(self, image_path, dest_path):
+        """Initialize the copier.
+        
+        Args:
+            image_path: Path of the selected image
+            dest_path: Path to copy the image to
+        """
+        super().__init__()
+        self.image_path = image_path
+        self.dest_path = dest_path
+        self.signals = ImageCopierSignals()
+    
+    def run(self):
+        """Copy the image, emitting signals.failed with the error message on failure."""
+        try:
+            DatabaseManager.copy_image(self.image_path, self.dest_path)
+        except OSError as e:
+            print(f"Error copying bill image: {e}")
+            self.signals.failed.emit(str(e))
+
+
+class TrieLoader(QThread):
+    """Worker thread that builds the name suggestion trie from a JSON list of names."""
+
+    loaded = pyqtSignal(object)
+
+    def __init__(self, names_file="unique_names.json"):
+        """Initialize the loader.
+
+        Args:
+            names_file: Path to the JSON file holding the list of names
+        """
+        super().__init__()
+        self.names_file = names_file
+
+    def run(self):
+        """Build the trie and emit it through loaded."""
+        trie = Trie()
+        try:
+            with open(self.names_file, 'r') as file:
+                names = json.load(file)
+            for name in names:
+                trie.insert(name)
+        except FileNotFoundError:
+            # Create the file if it doesn't exist
+            with open(self.names_file, 'w') as file:
+                json.dump([], file)
+        self.loaded.emit(trie)